@@ -0,0 +1,62 @@
+"""
+Runtime helpers shared by the example scripts
+
+Import this from a script in the examples directory; it isn't an example
+itself.
+"""
+
+import asyncio
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def start_log_listener(logger: logging.Logger, level: int = logging.INFO) -> QueueListener:
+    """
+    Route a logger through a queue so records are formatted and written on a
+    background thread instead of the event loop. Stop the returned listener
+    before exiting to flush it.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+
+    listener.start()
+    return listener
+
+
+def run(main: Coroutine[Any, Any, T], eager_tasks: bool = False) -> T:
+    """
+    Run a coroutine on uvloop's faster event loop when it's installed. With
+    eager_tasks (Python 3.12+), tasks that finish without suspending, such as
+    cache hits, run to completion without being scheduled on the loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if sys.version_info >= (3, 12):
+        new_event_loop = uvloop.new_event_loop if uvloop else asyncio.new_event_loop
+
+        def loop_factory() -> asyncio.AbstractEventLoop:
+            loop = new_event_loop()
+            if eager_tasks:
+                loop.set_task_factory(asyncio.eager_task_factory)
+            return loop
+
+        return asyncio.run(main, loop_factory=loop_factory)
+    # asyncio.run() only takes a loop factory, and eager tasks only exist,
+    # from 3.12; the policy API it replaces is still supported before that
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
@@ -16,21 +16,108 @@ Usage:
 """
 
 import asyncio
+import hashlib
+import logging
 import os
-from typing import List, Dict, Any
+import shelve
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool as MCPTool
 from langgraph.prebuilt import create_react_agent
 from langchain_anthropic import ChatAnthropic
 from langchain.schema import HumanMessage
 import json
 from dotenv import load_dotenv
 
+from _example_runtime import run as run_async, start_log_listener
+
 load_dotenv()
 
 # Configuration
 CAMINO_API_KEY = os.getenv("CAMINO_API_KEY", "your_camino_api_key_here")
 ANTHROPIC_API_KEY = os.getenv(
     "ANTHROPIC_API_KEY", "your_anthropic_api_key_here")
+# Optional path for persisting agent responses between runs
+PROMPT_CACHE_PATH = os.getenv("CAMINO_PROMPT_CACHE")
+# Set CAMINO_DEBUG=1 for debug logging and agent tool-call tracing
+DEBUG = os.getenv("CAMINO_DEBUG") == "1"
+# MCP tool schemas from the last run, keyed by a hash of the server URL
+_TOOLS_CACHE = Path("~/.cache/camino/tools.json").expanduser()
+
+logger = logging.getLogger("camino_agent")
+
+
+
+class PromptCache:
+    """
+    Exact-match cache of agent responses keyed by a hash of the prompt,
+    optionally persisted to disk with shelve so re-runs return instantly
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, str] = {}
+        self._loaded = not path
+
+    def load(self):
+        """
+        Load persisted entries from disk
+        """
+        if not self._loaded:
+            with shelve.open(self.path) as db:
+                self._entries.update(db)
+            self._loaded = True
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        if not self._loaded:
+            self.load()
+        return self._entries.get(key)
+
+    def set(self, key: str, value: str):
+        self._entries[key] = value
+        if self.path:
+            with shelve.open(self.path) as db:
+                db[key] = value
+
+
+def _tool_schemas(tools) -> List[Dict[str, Any]]:
+    """
+    Serializable MCP schemas for a list of LangChain MCP tools
+    """
+    return [
+        {"name": tool.name, "description": tool.description, "inputSchema": tool.args_schema}
+        for tool in tools
+    ]
+
+
+def _load_tool_schemas(cache_key: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        return json.loads(_TOOLS_CACHE.read_text()).get(cache_key)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_tool_schemas(cache_key: str, schemas: List[Dict[str, Any]]):
+    try:
+        cached = json.loads(_TOOLS_CACHE.read_text())
+    except (OSError, ValueError):
+        cached = {}
+    cached[cache_key] = schemas
+    try:
+        payload = json.dumps(cached)
+        _TOOLS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _TOOLS_CACHE.write_text(payload)
+    except (OSError, TypeError, ValueError) as e:
+        # The cache only speeds up the next start, so a failed write isn't fatal
+        logger.warning("Could not write MCP tool cache %s: %s", _TOOLS_CACHE, e)
 
 
 class CaminoLocationAgent:
@@ -38,9 +125,18 @@ class CaminoLocationAgent:
     A location-intelligent AI agent powered by Camino AI's MCP server
     """
 
-    def __init__(self, camino_api_key: str, anthropic_api_key: str):
+    def __init__(
+        self,
+        camino_api_key: str,
+        anthropic_api_key: str,
+        max_concurrency: int = 8,
+        cache_path: Optional[str] = None,
+        verbose: bool = False
+    ):
         self.camino_api_key = camino_api_key
         self.anthropic_api_key = anthropic_api_key
+        # Upper bound on in-flight agent invocations, to respect provider rate limits
+        self.max_concurrency = max_concurrency
         self.model = ChatAnthropic(
             model="claude-3-5-sonnet-latest",
             api_key=anthropic_api_key,
@@ -48,6 +144,23 @@ class CaminoLocationAgent:
         )
         self.agent = None
         self.client = None
+        self.cache = PromptCache(cache_path)
+        self.verbose = verbose
+        self._refresh_task = None
+        # Created lazily so the lock binds to the running event loop
+        self._setup_lock = None
+
+    async def setup_once(self):
+        """
+        Set up the MCP client and agent exactly once, even if called concurrently
+        """
+        if self.agent is not None:
+            return
+        if self._setup_lock is None:
+            self._setup_lock = asyncio.Lock()
+        async with self._setup_lock:
+            if self.agent is None:
+                await self.setup_mcp_client()
 
     async def setup_mcp_client(self):
         """
@@ -68,22 +181,57 @@ class CaminoLocationAgent:
         # Create the MultiServerMCPClient
         self.client = MultiServerMCPClient(mcp_config)
 
-        # Get all available tools from the MCP servers
-        tools = await self.client.get_tools()
-
-        print(
-            f"Connected to Camino AI MCP server. Available tools: {len(tools)}")
-        for tool in tools:
-            print(f"  - {tool.name}: {tool.description}")
+        # The URL embeds the API key, so only its hash is written to disk
+        connection = mcp_config["camino-ai"]
+        cache_key = hashlib.sha256(connection["url"].encode()).hexdigest()
+        cached_schemas = _load_tool_schemas(cache_key)
+
+        if cached_schemas is not None:
+            # Warm start: build tools from the cached schemas and check for
+            # changes on the server in the background
+            tools = [
+                convert_mcp_tool_to_langchain_tool(
+                    None, MCPTool.model_validate(schema), connection=connection)
+                for schema in cached_schemas
+            ]
+            self._refresh_task = asyncio.create_task(
+                self._refresh_tools_in_background(cache_key, cached_schemas))
+        else:
+            # Get all available tools from the MCP servers
+            tools = await self.client.get_tools()
+            _save_tool_schemas(cache_key, _tool_schemas(tools))
+
+        logger.info("Connected to Camino AI MCP server. Available tools: %d", len(tools))
+        if self.verbose:
+            for tool in tools:
+                logger.info("  - %s: %s", tool.name, tool.description)
 
         # Create the agent with location intelligence tools
-        self.agent = create_react_agent(
+        self.agent = self._create_agent(tools)
+
+        return tools
+
+    def _create_agent(self, tools):
+        return create_react_agent(
             self.model,
             tools,
-            debug=True  # Enable debug mode to see tool calls
+            debug=DEBUG  # Set CAMINO_DEBUG=1 to see tool calls
         )
 
-        return tools
+    async def _refresh_tools_in_background(self, cache_key: str, cached_schemas: List[Dict[str, Any]]):
+        """
+        Re-fetch the tool list and rebuild the agent if it changed since it was cached
+        """
+        try:
+            tools = await self.client.get_tools()
+        except Exception as e:
+            logger.warning("Could not refresh MCP tool list: %s", e)
+            return
+
+        schemas = _tool_schemas(tools)
+        if schemas != cached_schemas:
+            _save_tool_schemas(cache_key, schemas)
+            self.agent = self._create_agent(tools)
 
     async def query_location(self, user_query: str) -> str:
         """
@@ -107,37 +255,96 @@ class CaminoLocationAgent:
         User query: {user_query}
         """
 
+        cache_key = PromptCache.key(enhanced_query)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         response = await self.agent.ainvoke({
             "messages": [HumanMessage(content=enhanced_query)]
         })
 
-        return response["messages"][-1].content
+        content = response["messages"][-1].content
+        self.cache.set(cache_key, content)
+        return content
 
     async def batch_location_queries(self, queries: List[str]) -> Dict[str, str]:
         """
-        Process multiple location queries in batch
+        Process multiple location queries concurrently, bounded by max_concurrency
         """
-        results = {}
-        for i, query in enumerate(queries):
-            print(f"Processing query {i+1}/{len(queries)}: {query}")
-            try:
-                result = await self.query_location(query)
-                results[query] = result
-            except Exception as e:
-                results[query] = f"Error processing query: {str(e)}"
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _one(i: int, query: str):
+            """Answer one query, returning (query, succeeded, response or error)"""
+            async with sem:
+                logger.debug("Processing query %d/%d: %s", i + 1, len(queries), query)
+                try:
+                    return query, True, await self.query_location(query)
+                except Exception as e:
+                    return query, False, f"Error processing query: {str(e)}"
+
+        logger.info("Processing %d queries (up to %d at a time)...", len(queries), self.max_concurrency)
+        outcomes = await asyncio.gather(*[_one(i, q) for i, q in enumerate(queries)])
+        failed = sum(1 for _, ok, _ in outcomes if not ok)
+        logger.info("Processed %d queries (%d failed)", len(queries), failed)
+        return {query: response for query, _, response in outcomes}
+
+    async def batch_location_queries_batched(self, queries: List[str]) -> Dict[str, str]:
+        """
+        Answer multiple independent location queries with a single agent invocation,
+        paying the model round trip once instead of once per query.
 
-        return results
+        Falls back to batch_location_queries if the answers can't be parsed.
+        """
+        if not self.agent:
+            raise RuntimeError(
+                "Agent not initialized. Call setup_mcp_client() first.")
+
+        numbered = "\n".join(f"{i}) {query}" for i, query in enumerate(queries, 1))
+        batched_query = f"""
+        You are a location intelligence assistant powered by Camino AI.
+        Use the available location tools to answer each of the following {len(queries)} independent location queries.
+
+        Return only a JSON array of {len(queries)} strings, one answer per query, in the same order.
+
+        Queries:
+        {numbered}
+        """
+
+        response = await self.agent.ainvoke({
+            "messages": [HumanMessage(content=batched_query)]
+        })
+        content = response["messages"][-1].content
+
+        try:
+            answers = json.loads(content[content.index("["):content.rindex("]") + 1])
+        except ValueError:
+            answers = None
+
+        if not isinstance(answers, list) or len(answers) != len(queries):
+            logger.warning("Could not parse batched answers, answering queries individually")
+            return await self.batch_location_queries(queries)
+
+        return {query: str(answer) for query, answer in zip(queries, answers)}
 
     async def interactive_session(self):
         """
         Start an interactive session for location queries
         """
-        print("\nCamino AI Location Intelligence Agent")
-        print("Ask me about places, businesses, routes, and local recommendations!")
-        print("Type 'quit' to exit.\n")
+        sys.stdout.write(
+            "\nCamino AI Location Intelligence Agent\n"
+            "Ask me about places, businesses, routes, and local recommendations!\n"
+            "Type 'quit' to exit.\n\n"
+        )
+        sys.stdout.flush()
+
+        # Load the persisted response cache once, before the first query
+        self.cache.load()
 
         while True:
             try:
+                # Blocking on input() is fine here: nothing else runs on the
+                # loop between turns, and Ctrl-C lands in this try block
                 user_input = input("Your location query: ").strip()
 
                 if user_input.lower() in ['quit', 'exit', 'q']:
@@ -147,92 +354,118 @@ class CaminoLocationAgent:
                 if not user_input:
                     continue
 
-                print("Searching for location information...")
+                logger.info("Searching for location information...")
                 response = await self.query_location(user_input)
-                print(f"\nResponse:\n{response}\n")
-                print("-" * 80)
+                # One write and flush per turn
+                sys.stdout.write(f"\nResponse:\n{response}\n\n{'-' * 80}\n")
+                sys.stdout.flush()
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\nGoodbye!")
                 break
             except Exception as e:
-                print(f"Error: {str(e)}")
+                logger.error("Error: %s", e)
 
     async def close(self):
         """
         Clean up resources
         """
+        if self._refresh_task:
+            await self._refresh_task
         if self.client:
             await self.client.close()
 
 # Example usage functions
 
 
+@lru_cache(maxsize=None)
+def _get_agent() -> CaminoLocationAgent:
+    """
+    Process-wide agent shared by every entry point, so the MCP connection and
+    tool discovery are paid for once
+    """
+    return CaminoLocationAgent(CAMINO_API_KEY, ANTHROPIC_API_KEY, cache_path=PROMPT_CACHE_PATH)
+
+
 async def example_queries():
     """
     Demonstrate various location intelligence capabilities
     """
-    agent = CaminoLocationAgent(CAMINO_API_KEY, ANTHROPIC_API_KEY)
+    agent = _get_agent()
 
-    try:
-        # Setup the MCP client and agent
-        await agent.setup_mcp_client()
-
-        # Example queries showcasing different capabilities
-        example_queries_list = [
-            "Find quiet coffee shops near the Golden Gate Bridge",
-            "What restaurants are within walking distance of Times Square?",
-            "Plan a route from Central Park to the Museum of Natural History",
-            "Find family-friendly attractions in downtown Seattle",
-            "Recommend coworking spaces in the Mission District, San Francisco",
-            "What are the best rooftop bars with views in Manhattan?"
-        ]
-
-        print("Running example location queries...\n")
-
-        for query in example_queries_list:
-            print(f"Query: {query}")
-            response = await agent.query_location(query)
-            print(f"Response: {response}\n")
-            print("-" * 80)
-
-            # Add small delay between queries to be respectful to the API
-            await asyncio.sleep(1)
+    # Setup the MCP client and agent
+    await agent.setup_once()
 
-    finally:
-        await agent.close()
+    # Example queries showcasing different capabilities
+    example_queries_list = [
+        "Find quiet coffee shops near the Golden Gate Bridge",
+        "What restaurants are within walking distance of Times Square?",
+        "Plan a route from Central Park to the Museum of Natural History",
+        "Find family-friendly attractions in downtown Seattle",
+        "Recommend coworking spaces in the Mission District, San Francisco",
+        "What are the best rooftop bars with views in Manhattan?"
+    ]
+
+    logger.info("Running example location queries...\n")
+
+    # Queries run concurrently; the agent's semaphore keeps us respectful to the API
+    responses = await agent.batch_location_queries(example_queries_list)
+
+    lines = []
+    for query, response in responses.items():
+        lines.append(f"Query: {query}")
+        lines.append(f"Response: {response}\n")
+        lines.append("-" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 async def custom_location_workflow():
     """
     Example of a custom workflow using Camino AI for trip planning
     """
-    agent = CaminoLocationAgent(CAMINO_API_KEY, ANTHROPIC_API_KEY)
+    agent = _get_agent()
 
-    try:
-        await agent.setup_mcp_client()
+    await agent.setup_once()
+
+    # Multi-step trip planning workflow
+    trip_queries = [
+        "Find highly-rated breakfast spots in SoHo, New York",
+        "What museums are within walking distance of SoHo?",
+        "Recommend lunch places near the Metropolitan Museum of Art",
+        "Find evening entertainment options in the Theater District",
+        "Plan the most efficient route connecting these locations"
+    ]
+
+    logger.info("Planning a day trip in NYC using Camino AI...\n")
 
-        # Multi-step trip planning workflow
-        trip_queries = [
-            "Find highly-rated breakfast spots in SoHo, New York",
-            "What museums are within walking distance of SoHo?",
-            "Recommend lunch places near the Metropolitan Museum of Art",
-            "Find evening entertainment options in the Theater District",
-            "Plan the most efficient route connecting these locations"
-        ]
+    trip_plan = await agent.batch_location_queries(trip_queries)
 
-        print("Planning a day trip in NYC using Camino AI...\n")
+    lines = ["Complete Trip Plan:"]
+    for i, (query, response) in enumerate(trip_plan.items(), 1):
+        lines.append(f"\n{i}. {query}")
+        lines.append(f"   {response[:200]}..." if len(
+            response) > 200 else f"   {response}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-        trip_plan = await agent.batch_location_queries(trip_queries)
 
-        print("Complete Trip Plan:")
-        for i, (query, response) in enumerate(trip_plan.items(), 1):
-            print(f"\n{i}. {query}")
-            print(f"   {response[:200]}..." if len(
-                response) > 200 else f"   {response}")
+async def interactive_workflow():
+    """
+    Start an interactive session on the shared agent
+    """
+    agent = _get_agent()
 
+    await agent.setup_once()
+    await agent.interactive_session()
+
+
+async def run(entry_point):
+    """
+    Run an entry point, then close the shared agent once at shutdown
+    """
+    try:
+        await entry_point()
     finally:
-        await agent.close()
+        await _get_agent().close()
 
 if __name__ == "__main__":
     # Check for required API keys
@@ -252,20 +485,15 @@ if __name__ == "__main__":
 
     choice = input("Enter your choice (1-3): ").strip()
 
-    if choice == "1":
-        asyncio.run(example_queries())
-    elif choice == "2":
-        asyncio.run(custom_location_workflow())
-    elif choice == "3":
-        agent = CaminoLocationAgent(CAMINO_API_KEY, ANTHROPIC_API_KEY)
-
-        async def run_interactive():
-            try:
-                await agent.setup_mcp_client()
-                await agent.interactive_session()
-            finally:
-                await agent.close()
-
-        asyncio.run(run_interactive())
-    else:
-        print("Invalid choice. Please run the script again.")
+    listener = start_log_listener(logger, logging.DEBUG if DEBUG else logging.INFO)
+    try:
+        if choice == "1":
+            run_async(run(example_queries))
+        elif choice == "2":
+            run_async(run(custom_location_workflow))
+        elif choice == "3":
+            run_async(run(interactive_workflow))
+        else:
+            print("Invalid choice. Please run the script again.")
+    finally:
+        listener.stop()
@@ -17,25 +17,68 @@ Use cases:
 """
 
 import asyncio
+import heapq
+import math
 import os
-from typing import List, Dict, Any
-from dataclasses import dataclass
+import sys
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 
 from camino_ai import (
     CaminoAI,
     ContextRequest,
     QueryRequest, 
     JourneyRequest,
-    RelationshipRequest,
     Coordinate,
     Waypoint,
-    JourneyConstraints,
     TransportMode,
     APIError,
 )
 
+from _example_runtime import run
 
-@dataclass
+
+EARTH_RADIUS_M = 6371000
+
+
+def haversine_distance(start: Coordinate, end: Coordinate) -> float:
+    """Great-circle distance in meters between two coordinates."""
+    return haversine_distances(start, [end])[0]
+
+
+def haversine_distances(start: Coordinate, ends: List[Coordinate]) -> List[float]:
+    """Great-circle distances in meters from one coordinate to many, in a single pass."""
+    # Terms that depend only on the start point are computed once
+    phi1 = math.radians(start.lat)
+    cos_phi1 = math.cos(phi1)
+    lambda1 = math.radians(start.lon)
+    sin, cos, asin, sqrt, radians = math.sin, math.cos, math.asin, math.sqrt, math.radians
+    
+    distances = []
+    for end in ends:
+        phi2 = radians(end.lat)
+        a = sin((phi2 - phi1) / 2) ** 2 + cos_phi1 * cos(phi2) * sin((radians(end.lon) - lambda1) / 2) ** 2
+        distances.append(2 * EARTH_RADIUS_M * asin(sqrt(a)))
+    return distances
+
+
+def _poi_summary_dict(poi: "POIDetails") -> Dict[str, Any]:
+    return {
+        "name": poi.name,
+        "category": poi.category,
+        "distance_from_start": poi.context_distance,
+        "confidence": poi.confidence
+    }
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class POIDetails:
     """Enhanced POI information from query results."""
     name: str
@@ -44,15 +87,41 @@ class POIDetails:
     category: str = ""
     confidence: float = 0.0
     context_distance: float = 0.0
-    query_details: Dict[str, Any] = None
+    query_details: Dict[str, Any] = field(default_factory=dict)
 
 
 class LocationChainWorkflow:
     """A workflow class for chaining Camino AI APIs together."""
     
-    def __init__(self, api_key: str):
-        self.client = CaminoAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        concurrency: int = 8,
+        log: Callable[[str], None] = None,
+        client: CaminoAI = None
+    ):
+        # Reuse an existing client when given so workflows share one connection pool;
+        # only a client created here is closed by close()
+        self._owns_client = client is None
+        self.client = client or CaminoAI(api_key=api_key)
         self.verbose = True
+        # Output sink, print by default; pass a list's append to buffer output
+        # when running workflows concurrently
+        self.log = log or print
+        # Maximum number of in-flight API requests per fan-out
+        self._sem = asyncio.Semaphore(concurrency)
+        # Request templates built once without validation; each call copies one and
+        # fills in the per-request fields, skipping pydantic validation since the
+        # workflow controls every input
+        self._context_tpl = ContextRequest.model_construct(
+            location=Coordinate.model_construct(lat=0.0, lon=0.0), radius=0, context=""
+        )
+        self._query_tpl = QueryRequest.model_construct(query="")
+
+    async def _bounded(self, coro):
+        """Await a request while holding the concurrency semaphore."""
+        async with self._sem:
+            return await coro
     
     async def discover_area_pois(
         self, 
@@ -65,22 +134,21 @@ class LocationChainWorkflow:
         Returns a list of POI names/types found in the area.
         """
         if self.verbose:
-            print(f"🔍 Discovering POIs around {location.lat:.4f}, {location.lon:.4f}")
+            self.log(f"🔍 Discovering POIs around {location.lat:.4f}, {location.lon:.4f}")
         
         try:
-            context_request = ContextRequest(
-                location=location,
-                radius=f"{radius}m",
-                context=f"Find interesting places within {radius} meters"
-            )
+            context_request = self._context_tpl.model_copy(update={
+                "location": location,
+                "radius": radius,
+                "context": f"Find interesting places within {radius} meters"
+            })
             
             context_response = await self.client.context_async(context_request)
             
             # Extract POI names from context - this would depend on the actual API response structure
             # For now, we'll simulate based on nearby results
-            poi_names = []
-            if hasattr(context_response, 'nearby') and context_response.nearby:
-                poi_names = [poi.name for poi in context_response.nearby[:10]]  # Limit to top 10
+            nearby = getattr(context_response, 'nearby', None) or ()
+            poi_names = [poi.name for poi in islice(nearby, 10)]  # Limit to top 10
             
             # If no nearby POIs in context, generate some common ones based on categories
             if not poi_names and categories:
@@ -90,13 +158,13 @@ class LocationChainWorkflow:
                 poi_names = ["restaurants", "cafes", "attractions", "shopping"]
             
             if self.verbose:
-                print(f"   Found {len(poi_names)} POI types: {', '.join(poi_names[:3])}...")
-                
+                self.log(f"   Found {len(poi_names)} POI types: {', '.join(poi_names[:3])}...")
+            
             return poi_names
             
         except APIError as e:
             if self.verbose:
-                print(f"❌ Context discovery failed: {e.message}")
+                self.log(f"❌ Context discovery failed: {e.message}")
             return ["restaurants", "cafes"]  # Fallback
     
     async def query_poi_details(
@@ -111,61 +179,66 @@ class LocationChainWorkflow:
         Returns enriched POI details with locations and metadata.
         """
         if self.verbose:
-            print(f"📍 Querying details for {len(poi_names)} POI types...")
+            self.log(f"📍 Querying details for {len(poi_names)} POI types...")
         
-        all_pois = []
-        
-        for poi_name in poi_names:
-            try:
-                query_request = QueryRequest(
-                    q=f"{poi_name} near {location.lat}, {location.lon}",
-                    lat=location.lat,
-                    lon=location.lon,
-                    radius=radius,
-                    limit=limit_per_query
-                )
-                
-                query_response = await self.client.query_async(query_request)
-                
-                if query_response.results:
-                    for result in query_response.results:
-                        # Calculate distance from original location
-                        try:
-                            relationship = await self.client.relationship_async(
-                                RelationshipRequest(
-                                    start=location,
-                                    to=result.coordinate,
-                                    include=["distance"]
-                                )
-                            )
-                            distance = relationship.distance
-                        except:
-                            distance = 0.0
-                        
-                        poi_detail = POIDetails(
-                            name=result.name,
-                            coordinate=result.coordinate,
-                            address=result.address or "",
-                            category=result.category or poi_name,
-                            confidence=result.confidence or 0.0,
-                            context_distance=distance,
-                            query_details=result.metadata or {}
-                        )
-                        all_pois.append(poi_detail)
-                        
-                        if self.verbose and len(all_pois) <= 5:  # Show first few
-                            print(f"   • {poi_detail.name} ({poi_detail.category}) - {distance:.0f}m")
-                
-            except APIError as e:
-                if self.verbose:
-                    print(f"⚠️ Query failed for '{poi_name}': {e.message}")
-                continue
+        # Deduplicate names (order-preserving) and query them all concurrently
+        unique_names = list(dict.fromkeys(poi_names))
+        per_name = await asyncio.gather(
+            *[self._query_one(poi_name, location, radius, limit_per_query) for poi_name in unique_names]
+        )
+        all_pois = [poi for pois in per_name for poi in pois]
         
-        if self.verbose:
-            print(f"   Total POIs found: {len(all_pois)}")
-            
+        self._log_poi_summary(all_pois)
         return all_pois
     
+    async def _query_one(
+        self,
+        poi_name: str,
+        location: Coordinate,
+        radius: int,
+        limit: int
+    ) -> List[POIDetails]:
+        """Query a single POI type."""
+        try:
+            query_response = await self._bounded(self.client.query_async(
+                self._query_tpl.model_copy(update={
+                    "query": f"{poi_name} near {location.lat}, {location.lon}",
+                    "lat": location.lat,
+                    "lon": location.lon,
+                    "radius": radius,
+                    "limit": limit
+                })
+            ))
+        except APIError as e:
+            if self.verbose:
+                self.log(f"⚠️ Query failed for '{poi_name}': {e.message}")
+            return []
+        
+        results = query_response.results
+        # Only the distance is needed, so compute it locally instead of spending a
+        # /relationship round trip per result
+        distances = haversine_distances(location, [result.coordinate for result in results])
+        
+        return [
+            POIDetails(
+                name=result.name,
+                coordinate=result.coordinate,
+                address=result.address or "",
+                category=result.category or poi_name,
+                confidence=result.confidence or 0.0,
+                context_distance=distance,
+                query_details=result.metadata or {}
+            )
+            for result, distance in zip(results, distances)
+        ]
+    
+    def _log_poi_summary(self, pois: List[POIDetails]):
+        if not self.verbose:
+            return
+        for poi in pois[:5]:  # Show first few
+            self.log(f"   • {poi.name} ({poi.category}) - {poi.context_distance:.0f}m")
+        self.log(f"   Total POIs found: {len(pois)}")
+    
     async def plan_optimal_journey(
         self, 
         start_location: Coordinate,
@@ -184,16 +257,17 @@ class LocationChainWorkflow:
         selected_pois = self._select_best_pois(pois, max_stops)
         
         if self.verbose:
-            print(f"🗺️ Planning journey through {len(selected_pois)} stops...")
+            self.log(f"🗺️ Planning journey through {len(selected_pois)} stops...")
             for i, poi in enumerate(selected_pois, 1):
-                print(f"   {i}. {poi.name} ({poi.context_distance:.0f}m)")
+                self.log(f"   {i}. {poi.name} ({poi.context_distance:.0f}m)")
         
         try:
             # Create waypoints for journey
             waypoints = [
                 # Start location
                 Waypoint(
-                    location=start_location,
+                    lat=start_location.lat,
+                    lon=start_location.lon,
                     purpose="start"
                 )
             ]
@@ -202,25 +276,26 @@ class LocationChainWorkflow:
             for poi in selected_pois:
                 waypoints.append(
                     Waypoint(
-                        location=poi.coordinate,
+                        lat=poi.coordinate.lat,
+                        lon=poi.coordinate.lon,
                         purpose=f"visit:{poi.category}"
                     )
                 )
             
             journey_request = JourneyRequest(
                 waypoints=waypoints,
-                constraints=JourneyConstraints(
-                    transport=transport_mode.value,
-                    time_budget="2h",  # 2 hour budget
-                    preferences=["scenic", "safe"]
-                )
+                constraints={
+                    "transport": transport_mode.value,
+                    "time_budget": "2h",  # 2 hour budget
+                    "preferences": ["scenic", "safe"]
+                }
             )
             
             journey_response = await self.client.journey_async(journey_request)
             
             journey_summary = {
-                "total_distance": journey_response.total_distance,
-                "total_duration": journey_response.total_duration,
+                "total_distance": journey_response.total_distance_km * 1000,  # meters
+                "total_duration": journey_response.total_time_minutes * 60,  # seconds
                 "transport_mode": transport_mode.value,
                 "stops": len(selected_pois),
                 "selected_pois": [
@@ -234,45 +309,46 @@ class LocationChainWorkflow:
                 ],
                 "segments": [
                     {
-                        "distance": segment.distance,
-                        "duration": segment.duration,
-                        "instructions": segment.instructions
+                        "from": segment.from_.purpose,
+                        "to": segment.to.purpose,
+                        "distance_km": segment.distance_km,
+                        "estimated_time": segment.estimated_time
                     }
-                    for segment in journey_response.segments
+                    for segment in journey_response.route_segments
                 ],
                 "optimized_order": getattr(journey_response, 'optimized_order', None)
             }
             
             if self.verbose:
-                print(f"✅ Journey planned successfully:")
-                print(f"   Total distance: {journey_response.total_distance/1000:.1f} km")
-                print(f"   Total duration: {journey_response.total_duration/60:.0f} minutes")
-                print(f"   Segments: {len(journey_response.segments)}")
+                self.log(f"✅ Journey planned successfully:")
+                self.log(f"   Total distance: {journey_response.total_distance_km:.1f} km")
+                self.log(f"   Total duration: {journey_response.total_time_minutes} minutes")
+                self.log(f"   Segments: {len(journey_response.route_segments)}")
             
             return journey_summary
             
         except APIError as e:
             if self.verbose:
-                print(f"❌ Journey planning failed: {e.message}")
+                self.log(f"❌ Journey planning failed: {e.message}")
             return {"error": f"Journey planning failed: {e.message}"}
     
     def _select_best_pois(self, pois: List[POIDetails], max_stops: int) -> List[POIDetails]:
         """Select the best POIs based on confidence, distance, and diversity."""
-        # Sort by confidence and proximity
-        sorted_pois = sorted(
-            pois, 
-            key=lambda x: (x.confidence * 0.7 + (1000 - min(x.context_distance, 1000)) / 1000 * 0.3), 
-            reverse=True
-        )
+        # Score by confidence and proximity in a single pass, then heapify so only
+        # as many POIs are ordered as the diversity filter actually consumes
+        heap = [
+            (-(poi.confidence * 0.7 + (1000 - min(poi.context_distance, 1000)) / 1000 * 0.3), i)
+            for i, poi in enumerate(pois)
+        ]
+        heapq.heapify(heap)
         
         # Ensure diversity by limiting same categories
         selected = []
         categories_used = set()
         
-        for poi in sorted_pois:
-            if len(selected) >= max_stops:
-                break
-                
+        while heap and len(selected) < max_stops:
+            poi = pois[heapq.heappop(heap)[1]]
+            
             # Prefer diverse categories, but allow duplicates if confidence is very high
             if poi.category not in categories_used or poi.confidence > 0.9:
                 selected.append(poi)
@@ -291,8 +367,8 @@ class LocationChainWorkflow:
         """
         Run the complete workflow: context → query → journey
         """
-        print("🌍 Starting Complete Location Intelligence Workflow")
-        print("=" * 55)
+        self.log("🌍 Starting Complete Location Intelligence Workflow")
+        self.log("=" * 55)
         
         # Step 1: Discover POIs in area
         poi_names = await self.discover_area_pois(
@@ -325,37 +401,36 @@ class LocationChainWorkflow:
                 "journey_planned": "error" not in journey_plan
             },
             "discovered_poi_types": poi_names,
-            "poi_details": [
-                {
-                    "name": poi.name,
-                    "category": poi.category, 
-                    "distance_from_start": poi.context_distance,
-                    "confidence": poi.confidence
-                }
-                for poi in poi_details
-            ],
+            "poi_details": [_poi_summary_dict(poi) for poi in poi_details],
             "journey_plan": journey_plan
         }
     
     async def close(self):
-        """Clean up resources."""
-        await self.client.aclose()
+        """Clean up resources, leaving a client passed in by the caller open."""
+        if self._owns_client:
+            await self.client.aclose()
 
 
-async def example_food_tour_planning():
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> CaminoAI:
+    """Process-wide CaminoAI client shared by every example workflow."""
+    return CaminoAI(api_key=api_key)
+
+
+async def example_food_tour_planning(out: Callable[[str], None] = print):
     """Example: Plan a food tour in Manhattan"""
-    print("\n🍽️ Example: Food Tour Planning in Manhattan")
-    print("-" * 45)
+    out("\n🍽️ Example: Food Tour Planning in Manhattan")
+    out("-" * 45)
     
     api_key = os.getenv("CAMINO_API_KEY")
     if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
+        out("❌ Please set CAMINO_API_KEY environment variable")
         return
     
-    workflow = LocationChainWorkflow(api_key)
+    workflow = LocationChainWorkflow(api_key, log=out, client=_get_client(api_key))
     
     # Manhattan location (near Washington Square Park)
-    manhattan_location = Coordinate(lat=40.7308, lng=-73.9973)
+    manhattan_location = Coordinate(lat=40.7308, lon=-73.9973)
     
     result = await workflow.run_complete_workflow(
         location=manhattan_location,
@@ -365,38 +440,36 @@ async def example_food_tour_planning():
         max_stops=4
     )
     
-    print("\n📊 Workflow Results:")
-    print(f"• POI types discovered: {result['workflow_summary']['poi_types_discovered']}")
-    print(f"• Total POIs found: {result['workflow_summary']['total_pois_found']}")
-    print(f"• Journey planned: {'✅' if result['workflow_summary']['journey_planned'] else '❌'}")
+    out("\n📊 Workflow Results:")
+    out(f"• POI types discovered: {result['workflow_summary']['poi_types_discovered']}")
+    out(f"• Total POIs found: {result['workflow_summary']['total_pois_found']}")
+    out(f"• Journey planned: {'✅' if result['workflow_summary']['journey_planned'] else '❌'}")
     
     if result['workflow_summary']['journey_planned']:
         journey = result['journey_plan']
-        print(f"• Food tour distance: {journey['total_distance']/1000:.1f} km")
-        print(f"• Estimated duration: {journey['total_duration']/60:.0f} minutes")
-        print(f"• Number of stops: {journey['stops']}")
+        out(f"• Food tour distance: {journey['total_distance']/1000:.1f} km")
+        out(f"• Estimated duration: {journey['total_duration']/60:.0f} minutes")
+        out(f"• Number of stops: {journey['stops']}")
         
-        print("\n🎯 Selected Food Stops:")
+        out("\n🎯 Selected Food Stops:")
         for i, poi in enumerate(journey['selected_pois'], 1):
-            print(f"   {i}. {poi['name']} ({poi['category']}) - Confidence: {poi['confidence']:.2f}")
-    
-    await workflow.close()
+            out(f"   {i}. {poi['name']} ({poi['category']}) - Confidence: {poi['confidence']:.2f}")
 
 
-async def example_business_area_analysis():
+async def example_business_area_analysis(out: Callable[[str], None] = print):
     """Example: Analyze business services in an area"""
-    print("\n🏢 Example: Business Area Analysis in Financial District")  
-    print("-" * 55)
+    out("\n🏢 Example: Business Area Analysis in Financial District")  
+    out("-" * 55)
     
     api_key = os.getenv("CAMINO_API_KEY")
     if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
+        out("❌ Please set CAMINO_API_KEY environment variable")
         return
     
-    workflow = LocationChainWorkflow(api_key)
+    workflow = LocationChainWorkflow(api_key, log=out, client=_get_client(api_key))
     
     # Financial District, NYC
-    financial_district = Coordinate(lat=40.7074, lng=-74.0113)
+    financial_district = Coordinate(lat=40.7074, lon=-74.0113)
     
     result = await workflow.run_complete_workflow(
         location=financial_district,
@@ -406,25 +479,21 @@ async def example_business_area_analysis():
         max_stops=3
     )
     
-    print("\n📈 Business Analysis Results:")
-    print(f"• Service types found: {len(result['discovered_poi_types'])}")
-    print(f"• Total businesses: {result['workflow_summary']['total_pois_found']}")
+    out("\n📈 Business Analysis Results:")
+    out(f"• Service types found: {len(result['discovered_poi_types'])}")
+    out(f"• Total businesses: {result['workflow_summary']['total_pois_found']}")
     
-    # Show top businesses by category
-    business_by_category = {}
-    for poi in result['poi_details']:
-        category = poi['category']
-        if category not in business_by_category:
-            business_by_category[category] = []
-        business_by_category[category].append(poi)
+    # Show top businesses by category; sorting once up front leaves every
+    # category's list already ordered by confidence
+    business_by_category = defaultdict(list)
+    for poi in sorted(result['poi_details'], key=lambda x: x['confidence'], reverse=True):
+        business_by_category[poi['category']].append(poi)
     
-    print("\n🏛️ Top Businesses by Category:")
+    out("\n🏛️ Top Businesses by Category:")
     for category, businesses in business_by_category.items():
-        print(f"\n   {category.title()}:")
-        for business in sorted(businesses, key=lambda x: x['confidence'], reverse=True)[:2]:
-            print(f"   • {business['name']} (confidence: {business['confidence']:.2f})")
-    
-    await workflow.close()
+        out(f"\n   {category.title()}:")
+        for business in businesses[:2]:
+            out(f"   • {business['name']} (confidence: {business['confidence']:.2f})")
 
 
 async def main():
@@ -432,14 +501,31 @@ async def main():
     print("🚀 Camino AI - API Chaining Workflow Examples")
     print("=" * 50)
     
-    # Run food tour example
-    await example_food_tour_planning()
+    # Run both examples concurrently, buffering each one's output so the
+    # reports don't interleave on stdout
+    food_tour_output: List[str] = []
+    business_output: List[str] = []
+    try:
+        # Collect failures instead of raising, so one failing example doesn't
+        # throw away the other one's report
+        results = await asyncio.gather(
+            example_food_tour_planning(out=food_tour_output.append),
+            example_business_area_analysis(out=business_output.append),
+            return_exceptions=True,
+        )
+    finally:
+        # Close the shared client once, after every workflow is done with it
+        api_key = os.getenv("CAMINO_API_KEY")
+        if api_key:
+            await _get_client(api_key).aclose()
     
-    # Run business analysis example  
-    await example_business_area_analysis()
+    for output, result in zip((food_tour_output, business_output), results):
+        if isinstance(result, Exception):
+            output.append(f"❌ Example failed: {result!r}")
+    sys.stdout.write("\n".join(food_tour_output + business_output) + "\n")
     
     print("\n✨ All workflow examples completed!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
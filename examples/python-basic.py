@@ -7,7 +7,10 @@ queries, relationships, context, journeys, and routes.
 """
 
 import asyncio
+import math
 import os
+import sys
+from typing import List
 
 from camino_ai import (
     CaminoAI,
@@ -23,174 +26,219 @@ from camino_ai import (
 )
 from pydantic import ValidationError
 
+from _example_runtime import run
+
+CAMINO_API_KEY = os.getenv("CAMINO_API_KEY")
+EARTH_RADIUS_M = 6371000
+
+
+def haversine_matrix(waypoints: List[Waypoint]) -> List[List[float]]:
+    """Pairwise great-circle distances in meters between waypoints."""
+    lats = [math.radians(w.lat) for w in waypoints]
+    lons = [math.radians(w.lon) for w in waypoints]
+    cos_lats = [math.cos(lat) for lat in lats]
+    n = len(waypoints)
+
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            a = (math.sin((lats[j] - lats[i]) / 2) ** 2
+                 + cos_lats[i] * cos_lats[j] * math.sin((lons[j] - lons[i]) / 2) ** 2)
+            matrix[i][j] = matrix[j][i] = 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+    return matrix
+
+
+def nearest_neighbor_order(waypoints: List[Waypoint]) -> List[Waypoint]:
+    """
+    Order waypoints greedily by straight-line distance, keeping the first as
+    the start. For a handful of stops this is computed locally in microseconds.
+    """
+    if len(waypoints) < 3:
+        return list(waypoints)
+
+    matrix = haversine_matrix(waypoints)
+    order = [0]
+    remaining = set(range(1, len(waypoints)))
+    while remaining:
+        nearest = min(remaining, key=lambda j: matrix[order[-1]][j])
+        order.append(nearest)
+        remaining.remove(nearest)
+    return [waypoints[i] for i in order]
+
 
 async def main():
     """Run examples demonstrating Camino AI SDK functionality."""
 
     # Initialize client with API key from environment
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
+    if not CAMINO_API_KEY:
         print("❌ Please set CAMINO_API_KEY environment variable")
         return
 
-    client = CaminoAI(api_key=api_key, base_url="http://localhost:8080")
+    # One client serves every example below, reusing its connection pool
+    client = CaminoAI(api_key=CAMINO_API_KEY, base_url="http://localhost:8080")
 
     print("🌍 Camino AI Python SDK Examples")
     print("=" * 40)
 
+    central_park = Coordinate(lat=40.7831, lon=-73.9712)
+    times_square = Coordinate(lat=40.7589, lon=-73.9851)
+
+    query_request = QueryRequest(
+        query="Italian restaurants",
+        lat=central_park.lat,
+        lon=central_park.lon,
+        radius=1000,  # 1km radius
+        limit=5
+    )
+    relationship_request = RelationshipRequest(
+        start=central_park,
+        end=times_square,
+        include=["distance", "direction", "travel_time", "description"]
+    )
+    context_request = ContextRequest(
+        location=central_park,
+        radius=500,
+        categories=["restaurant", "entertainment", "shopping"]
+    )
+    journey_request = JourneyRequest(
+        # Submit the stops already in visiting order
+        waypoints=nearest_neighbor_order([
+            Waypoint(lat=40.7831, lon=-73.9712, purpose="Central Park"),
+            Waypoint(lat=40.7589, lon=-73.9851, purpose="Times Square"),
+            Waypoint(lat=40.7505, lon=-73.9934,
+                     purpose="Empire State Building")
+        ]),
+        constraints={
+            "transport": "walking",
+            "time_budget": "2 hours"
+        }
+    )
+    route_request = RouteRequest(
+        start_lat=40.7831,
+        start_lon=-73.9712,
+        end_lat=40.7589,
+        end_lon=-73.9851,
+        mode="foot",
+        include_geometry=True
+    )
+
+    # None of the examples depend on each other, so send every request at
+    # once and print the results in order as before
+    responses = await asyncio.gather(
+        client.search_async("eiffel tower"),
+        client.query_async("coffee shops in Manhattan"),
+        client.query_async(query_request),
+        client.relationship_async(relationship_request),
+        client.context_async(context_request),
+        client.journey_async(journey_request),
+        client.route_async(route_request),
+        return_exceptions=True,
+    )
+    for response in responses:
+        if isinstance(response, Exception) and not isinstance(response, APIError):
+            raise response
+    (search_response, coffee_response, italian_response, relationship_response,
+     context_response, journey_response, route_response) = responses
+
     # Example 1: Basic Query
     print("\n1️⃣ Basic Search Example")
-    try:
-        response = await client.search_async("eiffel tower")
-        print(f"✅ Found {len(response.results)} results")
-        for i, result in enumerate(response.results[:3]):  # Show first 3
+    if isinstance(search_response, APIError):
+        print(f"❌ Query failed: {search_response.message}")
+    else:
+        print(f"✅ Found {len(search_response.results)} results")
+        for i, result in enumerate(search_response.results[:3]):  # Show first 3
             print(f"   {i+1}. {result.display_name} - {result.lat}, {result.lon}")
-    except APIError as e:
-        print(f"❌ Query failed: {e.message}")
 
-    try:
-        response = await client.query_async("coffee shops in Manhattan")
-        print(f"✅ Found {response.total} coffee shops")
-        for i, result in enumerate(response.results[:3]):  # Show first 3
+    if isinstance(coffee_response, APIError):
+        print(f"❌ Query failed: {coffee_response.message}")
+    else:
+        print(f"✅ Found {coffee_response.total} coffee shops")
+        for i, result in enumerate(coffee_response.results[:3]):  # Show first 3
             print(f"   {i+1}. {result.name} - {result.address}")
-    except APIError as e:
-        print(f"❌ Query failed: {e.message}")
 
     # Example 2: Advanced Query with Parameters
     print("\n2️⃣ Advanced Query Example")
-    try:
-        central_park = Coordinate(lat=40.7831, lon=-73.9712)
-        query_request = QueryRequest(
-            query="Italian restaurants",
-            lat=central_park.lat,
-            lon=central_park.lon,
-            radius=1000,  # 1km radius
-            limit=5
-        )
-        response = await client.query_async(query_request)
+    if isinstance(italian_response, APIError):
+        print(f"❌ Advanced query failed: {italian_response.message}")
+    else:
         print(
-            f"✅ Found {len(response.results)} Italian restaurants near Central Park")
-        for result in response.results:
+            f"✅ Found {len(italian_response.results)} Italian restaurants near Central Park")
+        for result in italian_response.results:
             confidence_str = f" (confidence: {result.confidence:.2f})" if result.confidence else ""
             print(f"   • {result.name}{confidence_str}")
-    except APIError as e:
-        print(f"❌ Advanced query failed: {e.message}")
 
     # Example 3: Spatial Relationship
     print("\n3️⃣ Spatial Relationship Example")
-    try:
-        central_park = Coordinate(lat=40.7831, lon=-73.9712)
-        times_square = Coordinate(lat=40.7589, lon=-73.9851)
-
-        relationship_request = RelationshipRequest(
-            start=central_park,
-            end=times_square,
-            include=["distance", "direction", "travel_time", "description"]
-        )
-        response = await client.relationship_async(relationship_request)
-
+    if isinstance(relationship_response, APIError):
+        print(f"❌ Relationship calculation failed: {relationship_response.message}")
+    else:
         print(f"✅ Central Park to Times Square:")
         print(
-            f"   Distance: {response.distance} ({response.actual_distance_km:.2f} km)")
-        print(f"   Direction: {response.direction}")
-        print(f"   Walking time: {response.walking_time}")
-        print(f"   Driving time: {response.driving_time}")
-        print(f"   Description: {response.description}")
-    except APIError as e:
-        print(f"❌ Relationship calculation failed: {e.message}")
+            f"   Distance: {relationship_response.distance} ({relationship_response.actual_distance_km:.2f} km)")
+        print(f"   Direction: {relationship_response.direction}")
+        print(f"   Walking time: {relationship_response.walking_time}")
+        print(f"   Driving time: {relationship_response.driving_time}")
+        print(f"   Description: {relationship_response.description}")
 
     # Example 4: Location Context
     print("\n4️⃣ Location Context Example")
-    try:
-        context_request = ContextRequest(
-            location=Coordinate(lat=40.7831, lon=-73.9712),  # Central Park
-            radius=500,
-            categories=["restaurant", "entertainment", "shopping"]
-        )
-        response = await client.context_async(context_request)
-
+    if isinstance(context_response, APIError):
+        print(f"❌ Context request failed: {context_response.message}")
+    else:
+        places = context_response.relevant_places
         print("✅ Context for Central Park area:")
-        print(f"   Area description: {response.area_description}")
-        print(f"   Search radius: {response.search_radius}")
-        print(f"   Total places found: {response.total_places_found}")
+        print(f"   Area description: {context_response.area_description}")
+        print(f"   Search radius: {context_response.search_radius}")
+        print(f"   Total places found: {context_response.total_places_found}")
         print("   Relevant places:")
-        print(
-            f"     Restaurants: {', '.join(response.relevant_places.restaurants)}")
-        print(f"     Services: {', '.join(response.relevant_places.services)}")
-        print(f"     Shops: {', '.join(response.relevant_places.shops)}")
-        print(
-            f"     Attractions: {', '.join(response.relevant_places.attractions)}")
-    except APIError as e:
-        print(f"❌ Context request failed: {e.message}")
+        print(f"     Restaurants: {', '.join(places.restaurants)}")
+        print(f"     Services: {', '.join(places.services)}")
+        print(f"     Shops: {', '.join(places.shops)}")
+        print(f"     Attractions: {', '.join(places.attractions)}")
 
     # Example 5: Multi-waypoint Journey
     print("\n5️⃣ Journey Planning Example")
-    try:
-        waypoints = [
-            Waypoint(lat=40.7831, lon=-73.9712, purpose="Central Park"),
-            Waypoint(lat=40.7589, lon=-73.9851, purpose="Times Square"),
-            Waypoint(lat=40.7505, lon=-73.9934,
-                     purpose="Empire State Building")
+    if isinstance(journey_response, APIError):
+        print(f"❌ Journey planning failed: {journey_response.message}")
+    else:
+        # Collect the report and write it at once rather than a print per line
+        lines = [
+            "✅ Walking journey:",
+            f"   Feasible: {journey_response.feasible}",
+            f"   Total distance: {journey_response.total_distance_km} km",
+            f"   Total time: {journey_response.total_time_formatted}",
+            f"   Transport mode: {journey_response.transport_mode}",
+            f"   Route segments: {len(journey_response.route_segments)}",
         ]
 
-        journey_request = JourneyRequest(
-            waypoints=waypoints,
-            constraints={
-                "transport": "walking",
-                "time_budget": "2 hours"
-            }
-        )
-
-        response = await client.journey_async(journey_request)
-
-        print("✅ Walking journey:")
-        print(f"   Feasible: {response.feasible}")
-        print(f"   Total distance: {response.total_distance_km} km")
-        print(f"   Total time: {response.total_time_formatted}")
-        print(f"   Transport mode: {response.transport_mode}")
-        print(f"   Route segments: {len(response.route_segments)}")
-
-        for i, segment in enumerate(response.route_segments):
-            print(
-                f"   Segment {i+1}: {segment.from_.purpose} → {segment.to.purpose}")
-            print(
+        for i, segment in enumerate(journey_response.route_segments):
+            lines.append(
+                f"   Segment {i+1}: {segment.from_.purpose} → {segment.to.purpose}\n"
                 f"     Distance: {segment.distance_km} km, Time: {segment.estimated_time}")
 
-        print(f"   Analysis: {response.analysis.summary}")
-    except APIError as e:
-        print(f"❌ Journey planning failed: {e.message}")
+        lines.append(f"   Analysis: {journey_response.analysis.summary}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     # Example 6: Point-to-Point Route
     print("\n6️⃣ Point-to-Point Route Example")
-    try:
-        route_request = RouteRequest(
-            start_lat=40.7831,
-            start_lon=-73.9712,
-            end_lat=40.7589,
-            end_lon=-73.9851,
-            mode="foot",
-            include_geometry=True
-        )
-
-        response = await client.route_async(route_request)
-
+    if isinstance(route_response, APIError):
+        print(f"❌ Route calculation failed: {route_response.message}")
+    else:
         print("✅ Walking route:")
         print(
-            f"   Distance: {response.summary.total_distance_meters:.1f} meters")
+            f"   Distance: {route_response.summary.total_distance_meters:.1f} meters")
         print(
-            f"   Duration: {response.summary.total_duration_seconds/60:.1f} minutes")
-        print(f"   Instructions: {len(response.instructions)} steps")
-        print(f"   Geometry included: {response.include_geometry}")
+            f"   Duration: {route_response.summary.total_duration_seconds/60:.1f} minutes")
+        print(f"   Instructions: {len(route_response.instructions)} steps")
+        print(f"   Geometry included: {route_response.include_geometry}")
 
         # Show first few instructions
-        if response.instructions:
+        if route_response.instructions:
             print("   First few instructions:")
-            for i, instruction in enumerate(response.instructions[:3]):
+            for i, instruction in enumerate(route_response.instructions[:3]):
                 print(f"     {i+1}. {instruction}")
-    except APIError as e:
-        print(f"❌ Route calculation failed: {e.message}")
 
-    # Close client
+    # Close the async pool while its event loop is still running
     await client.aclose()
     print("\n✨ Examples completed!")
 
@@ -200,13 +248,12 @@ def sync_examples():
     print("\n🔄 Synchronous API Examples")
     print("=" * 30)
 
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
+    if not CAMINO_API_KEY:
         print("❌ Please set CAMINO_API_KEY environment variable")
         return
 
     # Using synchronous client
-    with CaminoAI(api_key=api_key) as client:
+    with CaminoAI(api_key=CAMINO_API_KEY) as client:
         try:
             response = client.query("pizza places in Brooklyn")
             print(f"✅ Sync query found {response.total} pizza places")
@@ -220,7 +267,7 @@ def sync_examples():
 
 if __name__ == "__main__":
     # Run async examples
-    asyncio.run(main())
+    run(main())
 
     # Run sync examples
     # sync_examples()
@@ -13,100 +13,131 @@ Install dependencies:
 Run with: python examples/python-crewai-integration.py
 """
 
+import atexit
+import math
 import os
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from crewai import Agent, Task, Crew
 from crewai_tools.adapters.mcp_server_adapter import MCPServerAdapter, SseServerParams
 
 
+# Resolved once so every demo sees the same configuration
+CAMINO_API_KEY = os.getenv("CAMINO_API_KEY")
+MCP_HEADERS = {"User-Agent": "CrewAI-MCP-Client/1.0"}
+
+
+@lru_cache(maxsize=1)
+def _get_mcp_tools(url: str, headers: frozenset):
+    """
+    Connect to the MCP server once and reuse the discovered tools for every
+    crew built in this process. The session is closed at interpreter exit.
+    """
+    adapter = MCPServerAdapter(SseServerParams(url=url, headers=dict(headers)))
+    mcp_tools = adapter.__enter__()
+    atexit.register(adapter.__exit__, None, None, None)
+    return mcp_tools
+
+
+def geographic_center(points: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """Spherical centroid of (lat, lon) points: mean of their 3D unit vectors."""
+    x = y = z = 0.0
+    for lat, lon in points:
+        phi, lam = math.radians(lat), math.radians(lon)
+        x += math.cos(phi) * math.cos(lam)
+        y += math.cos(phi) * math.sin(lam)
+        z += math.sin(phi)
+    return (
+        math.degrees(math.atan2(z, math.hypot(x, y))),
+        math.degrees(math.atan2(y, x)),
+    )
 
 
 def create_location_crew_with_mcp(camino_api_key: str) -> tuple[Agent, Agent, Agent]:
     """Create CrewAI crew with native MCP integration to Camino AI's hosted server."""
     
-    # Configure connection to Camino AI's hosted MCP server
-    server_params = SseServerParams(
-        url=f"https://mcp.getcamino.ai/mcp?caminoApiKey={camino_api_key}",
-        headers={
-            "User-Agent": "CrewAI-MCP-Client/1.0"
-        }
+    # Connect to Camino AI's hosted MCP server (the session and tool list are
+    # shared across calls)
+    mcp_tools = _get_mcp_tools(
+        f"https://mcp.getcamino.ai/mcp?caminoApiKey={camino_api_key}",
+        frozenset(MCP_HEADERS.items())
     )
     
     # Create agents with MCP tools from hosted server
-    with MCPServerAdapter(server_params) as mcp_tools:
+    
+    # Location Intelligence Analyst
+    location_analyst = Agent(
+        role="Location Intelligence Analyst",
+        goal="Analyze locations, find optimal spots, and provide geospatial insights using real-time data",
+        backstory="""You are an expert location analyst with access to Camino AI's 
+        advanced geospatial tools via MCP. You can query locations globally, 
+        analyze spatial relationships, and provide contextual information about places.
         
-        # Location Intelligence Analyst
-        location_analyst = Agent(
-            role="Location Intelligence Analyst",
-            goal="Analyze locations, find optimal spots, and provide geospatial insights using real-time data",
-            backstory="""You are an expert location analyst with access to Camino AI's 
-            advanced geospatial tools via MCP. You can query locations globally, 
-            analyze spatial relationships, and provide contextual information about places.
-            
-            Available tools through MCP:
-            - query_locations: Search for places using natural language
-            - get_location_context: Get detailed area information
-            - calculate_distance: Compute distances between points
-            - plan_route: Plan optimal routes between locations
-            
-            Always use these tools to provide accurate, real-time location data.""",
-            tools=mcp_tools,
-            verbose=True
-        )
+        Available tools through MCP:
+        - query_locations: Search for places using natural language
+        - get_location_context: Get detailed area information
+        - calculate_distance: Compute distances between points
+        - plan_route: Plan optimal routes between locations
         
-        # Route Planning Specialist  
-        route_planner = Agent(
-            role="Route Planning Specialist", 
-            goal="Plan optimal routes and analyze travel logistics using geospatial data",
-            backstory="""You are a route planning expert with access to Camino AI's 
-            routing capabilities through MCP integration. You specialize in creating 
-            efficient travel plans using real-time geospatial data.
-            
-            Your MCP-powered expertise includes:
-            - Planning routes for different transport modes
-            - Calculating precise travel times and distances
-            - Optimizing multi-stop journeys
-            - Analyzing spatial relationships between locations
-            
-            Always use the MCP tools for accurate routing information.""",
-            tools=mcp_tools,
-            verbose=True
-        )
+        Always use these tools to provide accurate, real-time location data.""",
+        tools=mcp_tools,
+        verbose=True
+    )
+    
+    # Route Planning Specialist  
+    route_planner = Agent(
+        role="Route Planning Specialist", 
+        goal="Plan optimal routes and analyze travel logistics using geospatial data",
+        backstory="""You are a route planning expert with access to Camino AI's 
+        routing capabilities through MCP integration. You specialize in creating 
+        efficient travel plans using real-time geospatial data.
         
-        # Travel Advisor
-        travel_advisor = Agent(
-            role="Travel Experience Advisor",
-            goal="Synthesize location and routing data to create comprehensive travel recommendations",
-            backstory="""You are a travel advisor with access to comprehensive location 
-            intelligence through Camino AI's MCP server. You combine location data 
-            with routing information to create exceptional travel experiences.
-            
-            You excel at using MCP tools to:
-            - Research destinations and local context
-            - Plan efficient routes and itineraries
-            - Find optimal meeting points for groups
-            - Provide practical travel recommendations
-            
-            Use the available MCP tools to enhance your recommendations with real data.""",
-            tools=mcp_tools,
-            verbose=True
-        )
+        Your MCP-powered expertise includes:
+        - Planning routes for different transport modes
+        - Calculating precise travel times and distances
+        - Optimizing multi-stop journeys
+        - Analyzing spatial relationships between locations
+        
+        Always use the MCP tools for accurate routing information.""",
+        tools=mcp_tools,
+        verbose=True
+    )
+    
+    # Travel Advisor
+    travel_advisor = Agent(
+        role="Travel Experience Advisor",
+        goal="Synthesize location and routing data to create comprehensive travel recommendations",
+        backstory="""You are a travel advisor with access to comprehensive location 
+        intelligence through Camino AI's MCP server. You combine location data 
+        with routing information to create exceptional travel experiences.
         
-        return location_analyst, route_planner, travel_advisor
+        You excel at using MCP tools to:
+        - Research destinations and local context
+        - Plan efficient routes and itineraries
+        - Find optimal meeting points for groups
+        - Provide practical travel recommendations
+        
+        Use the available MCP tools to enhance your recommendations with real data.""",
+        tools=mcp_tools,
+        verbose=True
+    )
+    
+    return location_analyst, route_planner, travel_advisor
+
 
+def _print_task_output(task_number: int):
+    """Task callback that prints a task's result in one write once it completes."""
+    def callback(output):
+        print(f"\nTask {task_number} Results:\n{'-' * 20}\n{output.raw}", flush=True)
+    return callback
 
-def demonstrate_crewai_mcp_integration():
+
+def demonstrate_crewai_mcp_integration(api_key: str):
     """Demonstrate CrewAI integration with Camino AI using native MCP adapter."""
     
     print("🤖 CrewAI + Camino AI MCP Integration Demo")
     print("=" * 50)
     
-    # Check API key
-    api_key = os.getenv('CAMINO_API_KEY')
-    if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
-        return
-    
     try:
         # Create agents with native MCP integration
         location_analyst, route_planner, travel_advisor = create_location_crew_with_mcp(api_key)
@@ -129,14 +160,19 @@ def demonstrate_crewai_mcp_integration():
         # Example 2: Group Meeting Point Optimization
         print("\n2️⃣ Group Meeting Point Task")
         
+        # Averaging three points is exact and free locally, so the agent only
+        # needs the tools for the venue search
+        center_lat, center_lon = geographic_center(
+            [(40.7589, -73.9851), (40.7831, -73.9712), (40.7074, -74.0113)]
+        )
         meeting_task = Task(
-            description="""Three friends are located at: Times Square (40.7589,-73.9851), 
+            description=f"""Three friends are located at: Times Square (40.7589,-73.9851), 
             Central Park (40.7831,-73.9712), and Wall Street (40.7074,-74.0113). 
+            Their geographic center point is ({center_lat:.4f},{center_lon:.4f}).
             Use the MCP tools to:
             1. Calculate distances between all locations
-            2. Find the geographic center point
-            3. Get context for the center area to find good meeting spots
-            4. Suggest restaurants or cafes near the optimal meeting point""",
+            2. Get context for the center area to find good meeting spots
+            3. Suggest restaurants or cafes near the optimal meeting point""",
             expected_output="""Optimal meeting location with coordinates, nearby venue 
             recommendations, and travel distances for each person.""",
             agent=route_planner
@@ -157,24 +193,24 @@ def demonstrate_crewai_mcp_integration():
             agent=travel_advisor
         )
     
-        # Create and run crew with MCP-enabled agents
-        crew = Crew(
-            agents=[location_analyst, route_planner, travel_advisor],
-            tasks=[restaurant_task, meeting_task, event_task],
-            verbose=True,
-            process="sequential"  # Execute tasks in sequence
-        )
+        # The tasks share no data, so give each its own crew; each result is
+        # printed as soon as its task finishes. The crews run one after another
+        # because they share one MCP session, which isn't known to be thread-safe.
+        crews = [
+            Crew(
+                agents=[task.agent],
+                tasks=[task],
+                verbose=True,
+                task_callback=_print_task_output(i)
+            )
+            for i, task in enumerate((restaurant_task, meeting_task, event_task), 1)
+        ]
         
         print("\n🚀 Starting CrewAI MCP crew execution...")
-        results = crew.kickoff()
-        
         print("\n✅ CrewAI MCP Integration Results:")
         print("=" * 40)
-        
-        for i, result in enumerate(results.tasks_output, 1):
-            print(f"\nTask {i} Results:")
-            print("-" * 20)
-            print(result.raw)
+        for crew in crews:
+            crew.kickoff()
             
     except Exception as e:
         print(f"❌ CrewAI MCP integration failed: {e}")
@@ -361,15 +397,15 @@ def main():
     print("=" * 50)
     
     # Check API key
-    if not os.getenv('CAMINO_API_KEY'):
+    if not CAMINO_API_KEY:
         print("⚠️  No CAMINO_API_KEY found.")
         print("   Set CAMINO_API_KEY to run full MCP integration examples.\n")
     
     # Run demonstrations
     demonstrate_mcp_integration_patterns()
     
-    if os.getenv('CAMINO_API_KEY'):
-        demonstrate_crewai_mcp_integration()
+    if CAMINO_API_KEY:
+        demonstrate_crewai_mcp_integration(CAMINO_API_KEY)
     else:
         print("\n🔒 Full CrewAI MCP integration requires API key")
     
@@ -9,21 +9,46 @@ Perfect for understanding the workflow before building more complex applications
 """
 
 import asyncio
+import hashlib
 import os
+import shelve
 from camino_ai import (
     CaminoAI,
     ContextRequest,
+    ContextResponse,
     QueryRequest, 
+    QueryResponse,
     JourneyRequest,
     Coordinate,
     Waypoint,
-    JourneyConstraints,
     TransportMode,
 )
 
+from _example_runtime import run
 
-async def simple_chaining_example():
+# Optional path for persisting context/query responses between runs
+QUERY_CACHE_PATH = os.getenv("CAMINO_QUERY_CACHE")
+
+
+async def cached_request(cache, call, request, response_model):
+    """
+    Return the cached response for an identical request, otherwise make the
+    call and store the response JSON under a hash of the request
+    """
+    key = hashlib.sha1(
+        f"{call.__name__}:{request.model_dump_json()}".encode()).hexdigest()
+    if key in cache:
+        return response_model.model_validate_json(cache[key])
+    
+    response = await call(request)
+    cache[key] = response.model_dump_json()
+    return response
+
+
+async def simple_chaining_example(cache=None):
     """Simple example of chaining context → query → journey APIs."""
+    if cache is None:
+        cache = {}
     
     api_key = os.getenv("CAMINO_API_KEY")
     if not api_key:
@@ -36,9 +61,30 @@ async def simple_chaining_example():
     async with CaminoAI(api_key=api_key) as client:
         
         # Starting location: Central Park, NYC
-        start_location = Coordinate(lat=40.7831, lng=-73.9712)
+        start_location = Coordinate(lat=40.7831, lon=-73.9712)
         print(f"📍 Starting location: Central Park ({start_location.lat}, {start_location.lon})")
         
+        # The POI searches below don't depend on the context response, so start
+        # them now and let them run while the context request is in flight
+        poi_queries = [
+            "Italian restaurants near Central Park",
+            "coffee shops with outdoor seating", 
+            "museums and cultural attractions"
+        ]
+        
+        # The searches don't depend on each other either, so run them concurrently
+        queries_task = asyncio.ensure_future(asyncio.gather(*[
+            # Inputs are known-good, so skip pydantic validation
+            cached_request(cache, client.query_async, QueryRequest.model_construct(
+                query=query_text,
+                lat=start_location.lat,
+                lon=start_location.lon,
+                radius=1000,
+                limit=2  # Get top 2 results per query
+            ), QueryResponse)
+            for query_text in poi_queries
+        ], return_exceptions=True))
+        
         # ============================================
         # STEP 1: Use /context to discover the area
         # ============================================
@@ -46,12 +92,13 @@ async def simple_chaining_example():
         
         context_request = ContextRequest(
             location=start_location,
-            radius="1000m",
+            radius=1000,
             context="Find interesting places and attractions nearby"
         )
         
         try:
-            context_response = await client.context_async(context_request)
+            context_response = await cached_request(
+                cache, client.context_async, context_request, ContextResponse)
             print(f"✅ Area context retrieved:")
             
             # Display context information
@@ -65,6 +112,7 @@ async def simple_chaining_example():
             
         except Exception as e:
             print(f"❌ Context request failed: {e}")
+            queries_task.cancel()
             return
         
         # ============================================
@@ -72,36 +120,21 @@ async def simple_chaining_example():
         # ============================================
         print("\n2️⃣ Querying for specific POIs...")
         
-        # Based on context, query for restaurants and cafes
-        poi_queries = [
-            "Italian restaurants near Central Park",
-            "coffee shops with outdoor seating", 
-            "museums and cultural attractions"
-        ]
+        responses = await queries_task
         
         all_pois = []
         
-        for query_text in poi_queries:
+        for query_text, query_response in zip(poi_queries, responses):
             print(f"   🔍 Searching: {query_text}")
             
-            query_request = QueryRequest(
-                q=query_text,
-                lat=start_location.lat,
-                lon=start_location.lon,
-                radius=1000,
-                limit=2  # Get top 2 results per query
-            )
+            if isinstance(query_response, Exception):
+                print(f"      ❌ Query failed: {query_response}")
+                continue
             
-            try:
-                query_response = await client.query_async(query_request)
-                
-                print(f"      Found {len(query_response.results)} results:")
-                for result in query_response.results:
-                    print(f"      • {result.name}")
-                    all_pois.append(result)
-                    
-            except Exception as e:
-                print(f"      ❌ Query failed: {e}")
+            print(f"      Found {len(query_response.results)} results:")
+            for result in query_response.results:
+                print(f"      • {result.name}")
+                all_pois.append(result)
         
         print(f"\n   ✅ Total POIs collected: {len(all_pois)}")
         
@@ -120,37 +153,38 @@ async def simple_chaining_example():
         # Create waypoints: start + selected POIs
         waypoints = [
             # Start point
-            Waypoint(
-                location=start_location,
+            Waypoint.model_construct(
+                lat=start_location.lat,
+                lon=start_location.lon,
                 purpose="start_point"
-            )
-        ]
-        
-        # Add POI waypoints
-        for i, poi in enumerate(selected_pois):
-            waypoints.append(
-                Waypoint(
-                    location=poi.coordinate,
+            ),
+            # POI waypoints
+            *(
+                Waypoint.model_construct(
+                    lat=poi.coordinate.lat,
+                    lon=poi.coordinate.lon,
                     purpose=f"visit_{poi.category or 'poi'}"
                 )
+                for poi in selected_pois
             )
+        ]
         
         journey_request = JourneyRequest(
             waypoints=waypoints,
-            constraints=JourneyConstraints(
-                transport="walking",
-                time_budget="3h",
-                preferences=["scenic"]
-            )
+            constraints={
+                "transport": "walking",
+                "time_budget": "3h",
+                "preferences": ["scenic"]
+            }
         )
         
         try:
             journey_response = await client.journey_async(journey_request)
             
             print("✅ Journey planned successfully!")
-            print(f"   📏 Total distance: {journey_response.total_distance/1000:.1f} km")
-            print(f"   ⏱️  Total duration: {journey_response.total_duration/60:.0f} minutes")
-            print(f"   🛤️  Route segments: {len(journey_response.segments)}")
+            print(f"   📏 Total distance: {journey_response.total_distance_km:.1f} km")
+            print(f"   ⏱️  Total duration: {journey_response.total_time_minutes} minutes")
+            print(f"   🛤️  Route segments: {len(journey_response.route_segments)}")
             
             # Show the planned stops
             print(f"\n   🎯 Planned stops:")
@@ -159,13 +193,12 @@ async def simple_chaining_example():
                 if poi.address:
                     print(f"         {poi.address}")
             
-            # Show first few route instructions
-            if journey_response.segments:
+            # Show the first few route segments
+            if journey_response.route_segments:
                 print(f"\n   🧭 Route preview:")
-                for i, segment in enumerate(journey_response.segments[:2], 1):
-                    if hasattr(segment, 'instructions') and segment.instructions:
-                        print(f"      {i}. {segment.instructions}")
-                        print(f"         ({segment.distance:.0f}m, {segment.duration/60:.0f} min)")
+                for i, segment in enumerate(journey_response.route_segments[:2], 1):
+                    print(f"      {i}. {segment.from_.purpose} → {segment.to.purpose}")
+                    print(f"         ({segment.distance_km:.1f} km, {segment.estimated_time})")
             
         except Exception as e:
             print(f"❌ Journey planning failed: {e}")
@@ -179,13 +212,17 @@ async def simple_chaining_example():
         print("✅ Context: Discovered area information")
         print(f"✅ Query: Found {len(all_pois)} POIs across {len(poi_queries)} searches")
         print(f"✅ Journey: Planned route through {len(selected_pois)} stops")
-        print(f"📊 Total workflow distance: {journey_response.total_distance/1000:.1f} km")
+        print(f"📊 Total workflow distance: {journey_response.total_distance_km:.1f} km")
 
 
 async def main():
     """Run the simple chaining example."""
-    await simple_chaining_example()
+    if QUERY_CACHE_PATH:
+        with shelve.open(QUERY_CACHE_PATH) as cache:
+            await simple_chaining_example(cache)
+    else:
+        await simple_chaining_example()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
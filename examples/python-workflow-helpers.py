@@ -8,6 +8,11 @@ chain APIs together with minimal code. Perfect for common use cases!
 
 import asyncio
 import os
+import sys
+from collections import defaultdict
+from typing import Callable, List
+
+import httpx
 from camino_ai import (
     CaminoAI, 
     AreaExplorer, 
@@ -15,237 +20,236 @@ from camino_ai import (
     Coordinate,
 )
 
+from _example_runtime import run
+
+# Per-POI line templates, bound once and filled with % in the report loops
+_STOP_LINE = "   %d. %s (%s)%s"
+_FOOD_STOP_LINE = "   %d. %s %s%s"
+_SERVICE_LINE = "      • %s%s"
+_CONFIDENCE_1F = " (confidence: %.1f)"
+_CONFIDENCE_2F = " (confidence: %.2f)"
+_DISTANCE_FROM_START = " (%.0fm from start)"
+
+# (lowercase category substring, emoji) pairs for the food tour example
+_FOOD_EMOJIS = (
+    ("italian restaurants", "🍝"),
+    ("pizzerias", "🍕"),
+    ("gelato", "🍨"),
+    ("bakeries", "🥖"),
+    ("wine", "🍷"),
+)
+
 
-async def example_1_area_explorer():
+async def example_1_area_explorer(explorer: AreaExplorer, out: Callable[[str], None] = print):
     """Example 1: Use AreaExplorer for complete area exploration workflow."""
     
-    print("🗺️ Example 1: Area Explorer Workflow")
-    print("-" * 40)
+    out("🗺️ Example 1: Area Explorer Workflow")
+    out("-" * 40)
     
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
-        return
+    # Times Square location
+    times_square = Coordinate(lat=40.7589, lon=-73.9851)
     
-    async with CaminoAI(api_key=api_key) as client:
-        # Create area explorer
-        explorer = AreaExplorer(client)
-        
-        # Times Square location
-        times_square = Coordinate(lat=40.7589, lng=-73.9851)
-        
-        # Run complete exploration workflow in one call!
-        result = await explorer.explore_and_plan(
-            location=times_square,
-            poi_types=["restaurants", "theaters", "attractions", "shopping"],
-            radius=800,  # 800 meters
-            max_journey_stops=4,
-            transport_mode="walking"
-        )
+    # Run complete exploration workflow in one call!
+    result = await explorer.explore_and_plan(
+        location=times_square,
+        poi_types=["restaurants", "theaters", "attractions", "shopping"],
+        radius=800,  # 800 meters
+        max_journey_stops=4,
+        transport_mode="walking"
+    )
+    
+    if result.success:
+        out("✅ Area exploration successful!")
+        out(f"   📍 Total POIs found: {result.total_pois_found}")
+        out(f"   🎯 Journey stops: {len(result.selected_pois)}")
+        out(f"   📏 Journey distance: {result.journey_distance/1000:.1f} km")
+        out(f"   ⏱️  Journey duration: {result.journey_duration/60:.0f} minutes")
         
-        if result.success:
-            print("✅ Area exploration successful!")
-            print(f"   📍 Total POIs found: {result.total_pois_found}")
-            print(f"   🎯 Journey stops: {len(result.selected_pois)}")
-            print(f"   📏 Journey distance: {result.journey_distance/1000:.1f} km")
-            print(f"   ⏱️  Journey duration: {result.journey_duration/60:.0f} minutes")
+        out("\n🎯 Selected stops for your journey:")
+        for i, poi in enumerate(result.selected_pois, 1):
+            confidence_str = _CONFIDENCE_2F % poi.confidence if poi.confidence > 0 else ""
+            out(_STOP_LINE % (i, poi.name, poi.category, confidence_str))
             
-            print("\n🎯 Selected stops for your journey:")
-            for i, poi in enumerate(result.selected_pois, 1):
-                confidence_str = f" (confidence: {poi.confidence:.2f})" if poi.confidence > 0 else ""
-                print(f"   {i}. {poi.name} ({poi.category}){confidence_str}")
-                
-        else:
-            print(f"❌ Exploration failed: {result.error_message}")
+    else:
+        out(f"❌ Exploration failed: {result.error_message}")
 
 
-async def example_2_quick_chain():
-    """Example 2: Use QuickChain for simple chaining operations."""
+async def _context_to_query_pattern(quick: QuickChain, location: Coordinate, out: Callable[[str], None]):
+    """Quick Pattern 1: Context → Query chaining."""
+    # This automatically gets area context, then queries for cafes
+    cafe_results = await quick.context_to_query(
+        location=location,
+        poi_type="artisanal coffee shops",
+        radius=600
+    )
     
-    print("\n⚡ Example 2: Quick Chain Operations")
-    print("-" * 35)
+    out(f"   Found {len(cafe_results)} coffee shops:")
+    for cafe in cafe_results[:3]:  # Show first 3
+        out(f"   • {cafe.name}")
+
+
+async def _query_to_journey_pattern(client: CaminoAI, quick: QuickChain, location: Coordinate, out: Callable[[str], None]):
+    """Quick Pattern 2: Query → Journey chaining."""
+    # First, get some art galleries in SoHo
+    from camino_ai import QueryRequest
     
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
-        return
+    # Inputs are known-good, so skip pydantic validation
+    query_request = QueryRequest.model_construct(
+        query="art galleries and museums in SoHo",
+        lat=location.lat,
+        lon=location.lon,
+        radius=500,
+        limit=6
+    )
     
-    async with CaminoAI(api_key=api_key) as client:
-        # Create quick chain helper
-        quick = QuickChain(client)
-        
-        # SoHo, NYC
-        soho_location = Coordinate(lat=40.7230, lng=-74.0030)
-        
-        # ==========================================
-        # Quick Pattern 1: Context → Query chaining
-        # ==========================================
-        print("🔍 Pattern 1: Context → Query chaining")
-        
-        try:
-            # This automatically gets area context, then queries for cafes
-            cafe_results = await quick.context_to_query(
-                location=soho_location,
-                poi_type="artisanal coffee shops",
-                radius=600
-            )
-            
-            print(f"   Found {len(cafe_results)} coffee shops:")
-            for cafe in cafe_results[:3]:  # Show first 3
-                print(f"   • {cafe.name}")
-                
-        except Exception as e:
-            print(f"   ❌ Context→Query failed: {e}")
+    query_response = await client.query_async(query_request)
+    out(f"   Queried and found {len(query_response.results)} art venues")
+    
+    # Now chain directly to journey planning
+    if query_response.results:
+        journey_plan = await quick.query_to_journey(
+            start_location=location,
+            query_results=query_response.results,
+            transport_mode="walking",
+            max_stops=3
+        )
         
-        # ==========================================  
-        # Quick Pattern 2: Query → Journey chaining
-        # ==========================================
-        print("\n🧭 Pattern 2: Query → Journey chaining")
+        out("   ✅ Art gallery tour planned:")
+        out(f"   📏 Tour distance: {journey_plan['total_distance']/1000:.1f} km")
+        out(f"   ⏱️  Tour duration: {journey_plan['total_duration']/60:.0f} minutes")
         
-        try:
-            # First, get some art galleries in SoHo
-            from camino_ai import QueryRequest
-            
-            query_request = QueryRequest(
-                q="art galleries and museums in SoHo",
-                lat=soho_location.lat,
-                lon=soho_location.lon,
-                radius=500,
-                limit=6
-            )
-            
-            query_response = await client.query_async(query_request)
-            print(f"   Queried and found {len(query_response.results)} art venues")
-            
-            # Now chain directly to journey planning
-            if query_response.results:
-                journey_plan = await quick.query_to_journey(
-                    start_location=soho_location,
-                    query_results=query_response.results,
-                    transport_mode="walking",
-                    max_stops=3
-                )
-                
-                print("   ✅ Art gallery tour planned:")
-                print(f"   📏 Tour distance: {journey_plan['total_distance']/1000:.1f} km")
-                print(f"   ⏱️  Tour duration: {journey_plan['total_duration']/60:.0f} minutes")
-                
-                print("   🎨 Gallery stops:")
-                for i, poi in enumerate(journey_plan['selected_pois'], 1):
-                    print(f"      {i}. {poi['name']}")
-                    
-        except Exception as e:
-            print(f"   ❌ Query→Journey failed: {e}")
+        out("   🎨 Gallery stops:")
+        for i, poi in enumerate(journey_plan['selected_pois'], 1):
+            out(f"      {i}. {poi['name']}")
 
 
-async def example_3_custom_food_tour():
+async def example_2_quick_chain(client: CaminoAI, out: Callable[[str], None] = print):
+    """Example 2: Use QuickChain for simple chaining operations."""
+    
+    out("\n⚡ Example 2: Quick Chain Operations")
+    out("-" * 35)
+    
+    # Create quick chain helper
+    quick = QuickChain(client)
+    
+    # SoHo, NYC
+    soho_location = Coordinate(lat=40.7230, lon=-74.0030)
+    
+    # The two patterns are independent, so run them together and report
+    # each one's output (or error) in order afterwards
+    context_query_output: List[str] = []
+    query_journey_output: List[str] = []
+    context_query_error, query_journey_error = await asyncio.gather(
+        _context_to_query_pattern(quick, soho_location, context_query_output.append),
+        _query_to_journey_pattern(client, quick, soho_location, query_journey_output.append),
+        return_exceptions=True
+    )
+    
+    # ==========================================
+    # Quick Pattern 1: Context → Query chaining
+    # ==========================================
+    out("🔍 Pattern 1: Context → Query chaining")
+    for line in context_query_output:
+        out(line)
+    if isinstance(context_query_error, Exception):
+        out(f"   ❌ Context→Query failed: {context_query_error}")
+    
+    # ==========================================  
+    # Quick Pattern 2: Query → Journey chaining
+    # ==========================================
+    out("\n🧭 Pattern 2: Query → Journey chaining")
+    for line in query_journey_output:
+        out(line)
+    if isinstance(query_journey_error, Exception):
+        out(f"   ❌ Query→Journey failed: {query_journey_error}")
+
+
+async def example_3_custom_food_tour(explorer: AreaExplorer, out: Callable[[str], None] = print):
     """Example 3: Custom food tour using workflow helpers."""
     
-    print("\n🍽️ Example 3: Custom Food Tour")
-    print("-" * 30)
+    out("\n🍽️ Example 3: Custom Food Tour")
+    out("-" * 30)
     
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
-        return
+    # Little Italy, NYC  
+    little_italy = Coordinate(lat=40.7193, lon=-73.9969)
     
-    async with CaminoAI(api_key=api_key) as client:
-        explorer = AreaExplorer(client)
-        
-        # Little Italy, NYC  
-        little_italy = Coordinate(lat=40.7193, lng=-73.9969)
-        
-        # Create a food-focused exploration
-        result = await explorer.explore_and_plan(
-            location=little_italy,
-            poi_types=[
-                "Italian restaurants", 
-                "authentic pizzerias",
-                "gelato shops",
-                "Italian bakeries",
-                "wine bars"
-            ],
-            radius=400,  # Smaller radius for focused area
-            max_pois_per_type=2,  # 2 of each type
-            max_journey_stops=5,
-            transport_mode="walking"
-        )
+    # Create a food-focused exploration
+    result = await explorer.explore_and_plan(
+        location=little_italy,
+        poi_types=[
+            "Italian restaurants", 
+            "authentic pizzerias",
+            "gelato shops",
+            "Italian bakeries",
+            "wine bars"
+        ],
+        radius=400,  # Smaller radius for focused area
+        max_pois_per_type=2,  # 2 of each type
+        max_journey_stops=5,
+        transport_mode="walking"
+    )
+    
+    if result.success:
+        out("🇮🇹 Little Italy food tour planned!")
+        out(f"   🍝 Food stops: {len(result.selected_pois)}")
+        out(f"   🚶 Walking distance: {result.journey_distance:.0f} meters")
+        out(f"   ⏱️  Estimated time: {result.journey_duration/60:.0f} minutes")
         
-        if result.success:
-            print("🇮🇹 Little Italy food tour planned!")
-            print(f"   🍝 Food stops: {len(result.selected_pois)}")
-            print(f"   🚶 Walking distance: {result.journey_distance:.0f} meters")
-            print(f"   ⏱️  Estimated time: {result.journey_duration/60:.0f} minutes")
-            
-            print("\n🍴 Your Italian food adventure:")
-            food_emojis = {"Italian restaurants": "🍝", "pizzerias": "🍕", 
-                          "gelato": "🍨", "bakeries": "🥖", "wine": "🍷"}
+        out("\n🍴 Your Italian food adventure:")
+        for i, poi in enumerate(result.selected_pois, 1):
+            category = poi.category.lower()
+            emoji = next((emoji for key, emoji in _FOOD_EMOJIS if key in category), "🍽️")
+            distance = _DISTANCE_FROM_START % poi.distance_from_origin if poi.distance_from_origin > 0 else ""
+            out(_FOOD_STOP_LINE % (i, emoji, poi.name, distance))
             
-            for i, poi in enumerate(result.selected_pois, 1):
-                emoji = next((emoji for key, emoji in food_emojis.items() 
-                            if key in poi.category.lower()), "🍽️")
-                distance = f" ({poi.distance_from_origin:.0f}m from start)" if poi.distance_from_origin > 0 else ""
-                print(f"   {i}. {emoji} {poi.name}{distance}")
-                
-        else:
-            print(f"❌ Food tour planning failed: {result.error_message}")
+    else:
+        out(f"❌ Food tour planning failed: {result.error_message}")
 
 
-async def example_4_business_district_analysis():
+async def example_4_business_district_analysis(explorer: AreaExplorer, out: Callable[[str], None] = print):
     """Example 4: Analyze a business district for services."""
     
-    print("\n🏢 Example 4: Business District Analysis")
-    print("-" * 40)
+    out("\n🏢 Example 4: Business District Analysis")
+    out("-" * 40)
     
-    api_key = os.getenv("CAMINO_API_KEY")
-    if not api_key:
-        print("❌ Please set CAMINO_API_KEY environment variable")
-        return
+    # Midtown Manhattan
+    midtown = Coordinate(lat=40.7549, lon=-73.9840)
     
-    async with CaminoAI(api_key=api_key) as client:
-        explorer = AreaExplorer(client)
-        
-        # Midtown Manhattan
-        midtown = Coordinate(lat=40.7549, lng=-73.9840)
+    # Analyze business services in the area
+    result = await explorer.explore_and_plan(
+        location=midtown,
+        poi_types=[
+            "coworking spaces",
+            "business centers", 
+            "meeting rooms",
+            "office supplies",
+            "professional services",
+            "corporate lunch spots"
+        ],
+        radius=600,
+        max_journey_stops=4,
+        transport_mode="walking"
+    )
+    
+    if result.success:
+        out("💼 Business district analysis complete!")
+        out(f"   🏢 Business services found: {result.total_pois_found}")
+        out(f"   📍 Recommended stops: {len(result.selected_pois)}")
         
-        # Analyze business services in the area
-        result = await explorer.explore_and_plan(
-            location=midtown,
-            poi_types=[
-                "coworking spaces",
-                "business centers", 
-                "meeting rooms",
-                "office supplies",
-                "professional services",
-                "corporate lunch spots"
-            ],
-            radius=600,
-            max_journey_stops=4,
-            transport_mode="walking"
-        )
+        # Group by category
+        by_category = defaultdict(list)
+        for poi in result.selected_pois:
+            by_category[poi.category].append(poi)
         
-        if result.success:
-            print("💼 Business district analysis complete!")
-            print(f"   🏢 Business services found: {result.total_pois_found}")
-            print(f"   📍 Recommended stops: {len(result.selected_pois)}")
-            
-            # Group by category
-            by_category = {}
-            for poi in result.selected_pois:
-                category = poi.category
-                if category not in by_category:
-                    by_category[category] = []
-                by_category[category].append(poi)
-            
-            print("\n🎯 Top business services by category:")
-            for category, pois in by_category.items():
-                print(f"   📂 {category.title()}:")
-                for poi in pois:
-                    confidence_str = f" (confidence: {poi.confidence:.1f})" if poi.confidence > 0 else ""
-                    print(f"      • {poi.name}{confidence_str}")
-                    
-        else:
-            print(f"❌ Business analysis failed: {result.error_message}")
+        out("\n🎯 Top business services by category:")
+        for category, pois in by_category.items():
+            out(f"   📂 {category.title()}:")
+            for poi in pois:
+                confidence_str = _CONFIDENCE_1F % poi.confidence if poi.confidence > 0 else ""
+                out(_SERVICE_LINE % (poi.name, confidence_str))
+                
+    else:
+        out(f"❌ Business analysis failed: {result.error_message}")
 
 
 async def main():
@@ -255,12 +259,41 @@ async def main():
     print("=" * 45)
     print("These examples show how easy it is to chain APIs together!")
     
-    # Run all examples
-    await example_1_area_explorer()
-    await example_2_quick_chain() 
-    await example_3_custom_food_tour()
-    await example_4_business_district_analysis()
+    api_key = os.getenv("CAMINO_API_KEY")
+    if not api_key:
+        print("❌ Please set CAMINO_API_KEY environment variable")
+        return
     
+    # One client for every example, so they all draw on the same warm
+    # connection pool
+    http_client = httpx.AsyncClient(
+        timeout=30.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+    
+    # Run all examples concurrently, buffering each one's output so the
+    # reports still print in order without interleaving
+    outputs: List[List[str]] = [[], [], [], []]
+    # CaminoAI leaves an injected client open, so the pool is closed here
+    async with http_client:
+        client = CaminoAI(api_key=api_key, async_http_client=http_client)
+        # One explorer serves every area exploration example
+        explorer = AreaExplorer(client)
+        # Collect failures instead of raising, so one failing example doesn't
+        # throw away the reports of the ones that succeeded
+        results = await asyncio.gather(
+            example_1_area_explorer(explorer, out=outputs[0].append),
+            example_2_quick_chain(client, out=outputs[1].append),
+            example_3_custom_food_tour(explorer, out=outputs[2].append),
+            example_4_business_district_analysis(explorer, out=outputs[3].append),
+            return_exceptions=True,
+        )
+    for output, result in zip(outputs, results):
+        if isinstance(result, Exception):
+            output.append(f"❌ Example failed: {result!r}")
+    sys.stdout.write("\n".join(line for output in outputs for line in output) + "\n")
+
     print("\n✨ All workflow examples completed!")
     print("\n💡 Key Benefits of Workflow Helpers:")
     print("   • ⚡ Simple one-line API chaining")
@@ -270,4 +303,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main(), eager_tasks=True)
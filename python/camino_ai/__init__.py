@@ -1,10 +1,8 @@
 """Camino AI Python SDK for location intelligence and spatial reasoning."""
 
 from .client import CaminoAI
+from .errors import APIError, AuthenticationError, CaminoError, RateLimitError
 from .models import (
-    APIError,
-    AuthenticationError,
-    CaminoError,
     ContextRequest,
     ContextResponse,
     Coordinate,
@@ -15,7 +13,6 @@ from .models import (
     QueryRequest,
     QueryResponse,
     QueryResult,
-    RateLimitError,
     RelationshipAnalysis,
     RelationshipRequest,
     RelationshipResponse,
@@ -1,21 +1,22 @@
 """Main client class for the Camino AI SDK."""
 
 import asyncio
+import json
 from typing import Any, Optional, Union
 
 import httpx
+import pydantic_core
 from httpx import AsyncClient, Client, Response
+from pydantic import BaseModel
 
+from .errors import APIError, AuthenticationError, RateLimitError
 from .models import (
-    APIError,
-    AuthenticationError,
     ContextRequest,
     ContextResponse,
     JourneyRequest,
     JourneyResponse,
     QueryRequest,
     QueryResponse,
-    RateLimitError,
     RelationshipRequest,
     RelationshipResponse,
     RouteRequest,
@@ -24,6 +25,16 @@ from .models import (
     SearchResponse,
 )
 
+# pydantic-core only ships from_json with pydantic >= 2.5
+_HAS_FROM_JSON = hasattr(pydantic_core, "from_json")
+
+
+def _load_json(content: bytes) -> Any:
+    """Decode a JSON response body, preferring pydantic-core's parser."""
+    if _HAS_FROM_JSON:
+        return pydantic_core.from_json(content)
+    return json.loads(content)
+
 
 class CaminoAI:
     """
@@ -38,6 +49,11 @@ class CaminoAI:
         timeout: Request timeout in seconds
         max_retries: Maximum number of retry attempts
         retry_backoff: Backoff multiplier for retries
+        http_client: Optional httpx.Client to use for synchronous requests.
+            The caller owns it; ``close()`` leaves it open.
+        async_http_client: Optional httpx.AsyncClient to use for asynchronous
+            requests, e.g. to share one connection pool between several clients.
+            The caller owns it; ``aclose()`` leaves it open.
     """
 
     def __init__(
@@ -47,6 +63,8 @@ class CaminoAI:
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_backoff: float = 1.0,
+        http_client: Optional[Client] = None,
+        async_http_client: Optional[AsyncClient] = None,
     ):
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
@@ -60,11 +78,21 @@ class CaminoAI:
             "User-Agent": "camino-ai-python/0.1.0",
         }
 
-        # Sync client (created lazily)
-        self._sync_client: Optional[Client] = None
+        # Injected clients don't carry our headers, so send them per request
+        self._request_headers = (
+            self._headers if http_client or async_http_client else None
+        )
+
+        # Only clients created here are closed by close()/aclose(); injected
+        # ones may be shared with other clients and belong to the caller
+        self._owns_sync_client = http_client is None
+        self._owns_async_client = async_http_client is None
 
-        # Async client (created lazily)
-        self._async_client: Optional[AsyncClient] = None
+        # Sync client (created lazily unless provided)
+        self._sync_client: Optional[Client] = http_client
+
+        # Async client (created lazily unless provided)
+        self._async_client: Optional[AsyncClient] = async_http_client
 
     @property
     def sync_client(self) -> Client:
@@ -88,11 +116,21 @@ class CaminoAI:
             )
         return self._async_client
 
-    def _handle_response(self, response: Response) -> dict[str, Any]:
-        """Handle HTTP response and raise appropriate exceptions."""
+    def _handle_response(
+        self, response: Response, response_model: Optional[type[BaseModel]] = None
+    ) -> Any:
+        """Handle HTTP response and raise appropriate exceptions.
+
+        When ``response_model`` is given, the body is parsed and validated in a
+        single ``model_validate_json`` pass instead of decoding it to Python
+        objects first. Otherwise it is decoded with pydantic-core's JSON parser,
+        which is faster than the standard library's.
+        """
         try:
             response.raise_for_status()
-            return response.json()
+            if response_model is not None:
+                return response_model.model_validate_json(response.content)
+            return _load_json(response.content)
         except httpx.HTTPStatusError as e:
             status_code = e.response.status_code
 
@@ -113,14 +151,22 @@ class CaminoAI:
         except httpx.RequestError as e:
             raise APIError(f"Request failed: {str(e)}") from e
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:  # type: ignore[misc,return]
+    def _make_request(  # type: ignore[return]
+        self,
+        method: str,
+        endpoint: str,
+        response_model: Optional[type[BaseModel]] = None,
+        **kwargs: Any,
+    ) -> Any:
         """Make synchronous HTTP request with retries."""
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = self.sync_client.request(method, url, **kwargs)
-                return self._handle_response(response)
+                response = self.sync_client.request(
+                    method, url, headers=self._request_headers, **kwargs
+                )
+                return self._handle_response(response, response_model)
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 if attempt == self.max_retries:
                     raise APIError(
@@ -132,14 +178,22 @@ class CaminoAI:
 
                 time.sleep(self.retry_backoff * (2**attempt))
 
-    async def _make_async_request(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:  # type: ignore[misc,return]
+    async def _make_async_request(  # type: ignore[return]
+        self,
+        method: str,
+        endpoint: str,
+        response_model: Optional[type[BaseModel]] = None,
+        **kwargs: Any,
+    ) -> Any:
         """Make asynchronous HTTP request with retries."""
         url = f"{self.base_url}{endpoint}"
 
         for attempt in range(self.max_retries + 1):
             try:
-                response = await self.async_client.request(method, url, **kwargs)
-                return self._handle_response(response)
+                response = await self.async_client.request(
+                    method, url, headers=self._request_headers, **kwargs
+                )
+                return self._handle_response(response, response_model)
             except (httpx.RequestError, httpx.TimeoutException) as e:
                 if attempt == self.max_retries:
                     raise APIError(
@@ -163,20 +217,24 @@ class CaminoAI:
         if isinstance(query, str):
             query = QueryRequest(query=query)  # type: ignore[call-arg]
 
-        data = self._make_request(
-            "GET", "/query", params=query.model_dump(exclude_none=True)
+        return self._make_request(
+            "GET",
+            "/query",
+            response_model=QueryResponse,
+            params=query.model_dump(exclude_none=True),
         )
-        return QueryResponse.model_validate(data)
 
     async def query_async(self, query: Union[str, QueryRequest]) -> QueryResponse:
         """Async version of query method."""
         if isinstance(query, str):
             query = QueryRequest(query=query)  # type: ignore[call-arg]
 
-        data = await self._make_async_request(
-            "GET", "/query", params=query.model_dump(exclude_none=True)
+        return await self._make_async_request(
+            "GET",
+            "/query",
+            response_model=QueryResponse,
+            params=query.model_dump(exclude_none=True),
         )
-        return QueryResponse.model_validate(data)
 
     # Search methods
     def search(self, query: Union[str, SearchRequest]) -> SearchResponse:
@@ -252,19 +310,23 @@ class CaminoAI:
         Returns:
             RelationshipResponse with spatial relationship info
         """
-        data = self._make_request(
-            "POST", "/relationship", json=request.model_dump(exclude_none=True)
+        return self._make_request(
+            "POST",
+            "/relationship",
+            response_model=RelationshipResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return RelationshipResponse.model_validate(data)
 
     async def relationship_async(
         self, request: RelationshipRequest
     ) -> RelationshipResponse:
         """Async version of relationship method."""
-        data = await self._make_async_request(
-            "POST", "/relationship", json=request.model_dump(exclude_none=True)
+        return await self._make_async_request(
+            "POST",
+            "/relationship",
+            response_model=RelationshipResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return RelationshipResponse.model_validate(data)
 
     # Context methods
     def context(self, request: ContextRequest) -> ContextResponse:
@@ -277,17 +339,21 @@ class CaminoAI:
         Returns:
             ContextResponse with location context
         """
-        data = self._make_request(
-            "POST", "/context", json=request.model_dump(exclude_none=True)
+        return self._make_request(
+            "POST",
+            "/context",
+            response_model=ContextResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return ContextResponse.model_validate(data)
 
     async def context_async(self, request: ContextRequest) -> ContextResponse:
         """Async version of context method."""
-        data = await self._make_async_request(
-            "POST", "/context", json=request.model_dump(exclude_none=True)
+        return await self._make_async_request(
+            "POST",
+            "/context",
+            response_model=ContextResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return ContextResponse.model_validate(data)
 
     # Journey methods
     def journey(self, request: JourneyRequest) -> JourneyResponse:
@@ -300,17 +366,21 @@ class CaminoAI:
         Returns:
             JourneyResponse with optimized journey plan
         """
-        data = self._make_request(
-            "POST", "/journey", json=request.model_dump(exclude_none=True)
+        return self._make_request(
+            "POST",
+            "/journey",
+            response_model=JourneyResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return JourneyResponse.model_validate(data)
 
     async def journey_async(self, request: JourneyRequest) -> JourneyResponse:
         """Async version of journey method."""
-        data = await self._make_async_request(
-            "POST", "/journey", json=request.model_dump(exclude_none=True)
+        return await self._make_async_request(
+            "POST",
+            "/journey",
+            response_model=JourneyResponse,
+            json=request.model_dump(exclude_none=True),
         )
-        return JourneyResponse.model_validate(data)
 
     # Route methods
     def route(self, request: RouteRequest) -> RouteResponse:
@@ -323,26 +393,30 @@ class CaminoAI:
         Returns:
             RouteResponse with route information
         """
-        data = self._make_request(
-            "GET", "/route", params=request.model_dump(exclude_none=True)
+        return self._make_request(
+            "GET",
+            "/route",
+            response_model=RouteResponse,
+            params=request.model_dump(exclude_none=True),
         )
-        return RouteResponse.model_validate(data)
 
     async def route_async(self, request: RouteRequest) -> RouteResponse:
         """Async version of route method."""
-        data = await self._make_async_request(
-            "GET", "/route", params=request.model_dump(exclude_none=True)
+        return await self._make_async_request(
+            "GET",
+            "/route",
+            response_model=RouteResponse,
+            params=request.model_dump(exclude_none=True),
         )
-        return RouteResponse.model_validate(data)
 
     def close(self) -> None:
-        """Close synchronous client."""
-        if self._sync_client:
+        """Close synchronous client, unless it was provided by the caller."""
+        if self._sync_client and self._owns_sync_client:
             self._sync_client.close()
 
     async def aclose(self) -> None:
-        """Close asynchronous client."""
-        if self._async_client:
+        """Close asynchronous client, unless it was provided by the caller."""
+        if self._async_client and self._owns_async_client:
             await self._async_client.aclose()
 
     def __enter__(self) -> "CaminoAI":
@@ -0,0 +1,42 @@
+"""Exception classes for the Camino AI SDK."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class CaminoError(Exception):
+    """Base exception for Camino AI SDK."""
+
+    def __init__(self, message: str, details: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.message = message
+        self.details = details or {}
+
+
+class APIError(CaminoError):
+    """API-related error."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int | None = None,
+        response: dict[str, Any] | None = None,
+    ):
+        super().__init__(message, response)
+        self.status_code = status_code
+        self.response = response
+
+
+class AuthenticationError(APIError):
+    """Authentication failed."""
+
+    pass
+
+
+class RateLimitError(APIError):
+    """Rate limit exceeded."""
+
+    def __init__(self, message: str, retry_after: int | None = None):
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
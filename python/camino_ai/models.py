@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
 
+from .errors import (  # noqa: F401 - re-exported for backwards compatibility
+    APIError,
+    AuthenticationError,
+    CaminoError,
+    RateLimitError,
+)
+
 
 class Coordinate(BaseModel):
     """Geographic coordinate with latitude and longitude."""
@@ -19,6 +27,22 @@ class Coordinate(BaseModel):
         """Alias for lon for backward compatibility."""
         return self.lon
 
+    @classmethod
+    def from_arrays(
+        cls, lats: Sequence[float], lons: Sequence[float]
+    ) -> list[Coordinate]:
+        """Build coordinates from parallel latitude/longitude sequences.
+
+        Values are trusted and not validated, which avoids per-point validation
+        overhead when converting large batches of known-good coordinates.
+        """
+        if len(lats) != len(lons):
+            raise ValueError("lats and lons must have the same length")
+        return [
+            cls.model_construct(lat=float(lat), lon=float(lon))
+            for lat, lon in zip(lats, lons)
+        ]
+
 
 class TransportMode(str, Enum):
     """Available transport modes for routing."""
@@ -536,41 +560,3 @@ class SearchResponse(BaseModel):
     """Response model for search results."""
 
     results: list[SearchResult] = Field(..., description="List of search results")
-
-
-# Exception classes
-class CaminoError(Exception):
-    """Base exception for Camino AI SDK."""
-
-    def __init__(self, message: str, details: dict[str, Any] | None = None):
-        super().__init__(message)
-        self.message = message
-        self.details = details or {}
-
-
-class APIError(CaminoError):
-    """API-related error."""
-
-    def __init__(
-        self,
-        message: str,
-        status_code: int | None = None,
-        response: dict[str, Any] | None = None,
-    ):
-        super().__init__(message, response)
-        self.status_code = status_code
-        self.response = response
-
-
-class AuthenticationError(APIError):
-    """Authentication failed."""
-
-    pass
-
-
-class RateLimitError(APIError):
-    """Rate limit exceeded."""
-
-    def __init__(self, message: str, retry_after: int | None = None):
-        super().__init__(message, status_code=429)
-        self.retry_after = retry_after
@@ -6,13 +6,16 @@ multiple Camino AI endpoints for common use cases like area exploration,
 route planning, and POI discovery.
 """
 
+import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
 from .client import CaminoAI
+from .errors import APIError
 from .models import (
-    APIError,
     ContextRequest,
+    ContextResponse,
     Coordinate,
     JourneyRequest,
     QueryRequest,
@@ -57,8 +60,18 @@ class AreaExplorer:
     3. Plan an optimal route through selected POIs
     """
 
-    def __init__(self, client: CaminoAI):
+    def __init__(self, client: CaminoAI, max_concurrent_requests: int = 8):
         self.client = client
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_slots: asyncio.Semaphore | None = None
+
+    @property
+    def _slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding this explorer's in-flight query/distance calls."""
+        # Created lazily so it belongs to the event loop that first uses it
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._request_slots
 
     async def explore_and_plan(
         self,
@@ -139,7 +152,7 @@ class AreaExplorer:
         """Get contextual information about an area."""
         context_request = ContextRequest(
             location=location,
-            radius=f"{radius}m",
+            radius=radius,
             context="Discover interesting places and local information",
         )
 
@@ -163,42 +176,53 @@ class AreaExplorer:
     async def _query_poi_details(
         self, location: Coordinate, poi_types: list[str], radius: int, max_per_type: int
     ) -> list[WorkflowPOI]:
-        """Query detailed information for each POI type."""
-        all_pois = []
-
-        for poi_type in poi_types:
-            query_request = QueryRequest(
-                q=f"{poi_type} near me",
-                lat=location.lat,
-                lon=location.lon,
-                radius=radius,
-                limit=max_per_type,
-            )
-
-            try:
-                query_response = await self.client.query_async(query_request)
-
-                for result in query_response.results:
-                    # Calculate distance from start location
-                    distance = await self._calculate_distance(
-                        location, result.coordinate
-                    )
+        """Query detailed information for each POI type concurrently."""
+        pois_per_type = await asyncio.gather(
+            *[
+                self._query_poi_type(location, poi_type, radius, max_per_type)
+                for poi_type in poi_types
+            ]
+        )
+        return [poi for pois in pois_per_type for poi in pois]
 
-                    workflow_poi = WorkflowPOI(
-                        name=result.name,
-                        coordinate=result.coordinate,
-                        category=result.category or poi_type,
-                        address=result.address or "",
-                        confidence=result.confidence or 0.0,
-                        distance_from_origin=distance,
-                        metadata=result.metadata or {},
-                    )
-                    all_pois.append(workflow_poi)
+    async def _query_poi_type(
+        self, location: Coordinate, poi_type: str, radius: int, max_per_type: int
+    ) -> list[WorkflowPOI]:
+        """Query POIs of a single type, with their distance from the start."""
+        query_request = QueryRequest(
+            query=f"{poi_type} near me",
+            lat=location.lat,
+            lon=location.lon,
+            radius=radius,
+            limit=max_per_type,
+        )
 
-            except APIError:
-                continue  # Skip failed queries
+        try:
+            async with self._slots:
+                query_response = await self.client.query_async(query_request)
+        except APIError:
+            return []  # Skip failed queries
+
+        # Calculate distance from start location
+        distances = await asyncio.gather(
+            *[
+                self._calculate_distance(location, result.coordinate)
+                for result in query_response.results
+            ]
+        )
 
-        return all_pois
+        return [
+            WorkflowPOI(
+                name=result.name,
+                coordinate=result.coordinate,
+                category=result.category or poi_type,
+                address=result.address or "",
+                confidence=result.confidence or 0.0,
+                distance_from_origin=distance,
+                metadata=result.metadata or {},
+            )
+            for result, distance in zip(query_response.results, distances)
+        ]
 
     async def _calculate_distance(
         self, from_loc: Coordinate, to_loc: Coordinate
@@ -208,10 +232,11 @@ class AreaExplorer:
             relationship_request = RelationshipRequest(
                 start=from_loc, end=to_loc, include=["distance"]
             )
-            relationship_response = await self.client.relationship_async(
-                relationship_request
-            )
-            return relationship_response.total_distance_km * 1000  # Convert to meters
+            async with self._slots:
+                relationship_response = await self.client.relationship_async(
+                    relationship_request
+                )
+            return relationship_response.actual_distance_km * 1000  # Convert to meters
         except APIError:
             return 0.0  # Fallback if distance calculation fails
 
@@ -253,11 +278,17 @@ class AreaExplorer:
             return {"distance": 0.0, "duration": 0.0}
 
         # Create waypoints
-        waypoints = [Waypoint(location=start_location, purpose="start")]
+        waypoints = [
+            Waypoint(lat=start_location.lat, lon=start_location.lon, purpose="start")
+        ]
 
         for poi in pois:
             waypoints.append(
-                Waypoint(location=poi.coordinate, purpose=f"visit_{poi.category}")
+                Waypoint(
+                    lat=poi.coordinate.lat,
+                    lon=poi.coordinate.lon,
+                    purpose=f"visit_{poi.category}",
+                )
             )
 
         journey_request = JourneyRequest(
@@ -272,9 +303,9 @@ class AreaExplorer:
         try:
             journey_response = await self.client.journey_async(journey_request)
             return {
-                "distance": journey_response.total_distance,
-                "duration": journey_response.total_duration,
-                "segments": journey_response.segments,
+                "distance": journey_response.total_distance_km * 1000,  # meters
+                "duration": journey_response.total_time_minutes * 60,  # seconds
+                "segments": journey_response.route_segments,
             }
         except APIError:
             return {"distance": 0.0, "duration": 0.0}
@@ -288,8 +319,40 @@ class QuickChain:
     the full workflow overhead.
     """
 
+    # Most recent area contexts kept per instance
+    CONTEXT_CACHE_SIZE = 256
+
     def __init__(self, client: CaminoAI):
         self.client = client
+        self._context_cache: OrderedDict[tuple, asyncio.Future] = OrderedDict()
+
+    async def _get_context(self, location: Coordinate, radius: int) -> ContextResponse:
+        """
+        Get area context, reusing the result for the same rounded location and
+        radius. Concurrent callers share a single in-flight request.
+        """
+        key = (round(location.lat, 4), round(location.lon, 4), radius)
+        future = self._context_cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self.client.context_async(
+                    ContextRequest(location=location, radius=radius)
+                )
+            )
+            self._context_cache[key] = future
+            if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+        else:
+            self._context_cache.move_to_end(key)
+
+        try:
+            # Shield so one cancelled caller doesn't cancel the shared request
+            return await asyncio.shield(future)
+        except Exception:
+            # Don't cache failures, whether from the API or a malformed body
+            if self._context_cache.get(key) is future:
+                del self._context_cache[key]
+            raise
 
     async def context_to_query(
         self, location: Coordinate, poi_type: str, radius: int = 1000
@@ -307,17 +370,16 @@ class QuickChain:
         """
         # Get context first (this helps with query refinement)
         try:
-            context_request = ContextRequest(location=location, radius=f"{radius}m")
-            await self.client.context_async(context_request)
+            await self._get_context(location, radius)
             # Context provides area understanding for better query results
         except APIError:
             pass  # Continue even if context fails
 
         # Now query for specific POIs with area context
         query_request = QueryRequest(
-            q=f"{poi_type} in this area",
+            query=f"{poi_type} in this area",
             lat=location.lat,
-            lon=location.lng,
+            lon=location.lon,
             radius=radius,
             limit=10,
         )
@@ -353,12 +415,15 @@ class QuickChain:
         )[:max_stops]
 
         # Create waypoints
-        waypoints = [Waypoint(location=start_location, purpose="start")]
+        waypoints = [
+            Waypoint(lat=start_location.lat, lon=start_location.lon, purpose="start")
+        ]
 
         for result in selected_results:
             waypoints.append(
                 Waypoint(
-                    location=result.coordinate,
+                    lat=result.coordinate.lat,
+                    lon=result.coordinate.lon,
                     purpose=f"visit_{result.category or 'poi'}",
                 )
             )
@@ -372,8 +437,8 @@ class QuickChain:
         journey_response = await self.client.journey_async(journey_request)
 
         return {
-            "total_distance": journey_response.total_distance,
-            "total_duration": journey_response.total_duration,
+            "total_distance": journey_response.total_distance_km * 1000,  # meters
+            "total_duration": journey_response.total_time_minutes * 60,  # seconds
             "stops": len(selected_results),
             "selected_pois": [
                 {
@@ -385,5 +450,5 @@ class QuickChain:
                 }
                 for result in selected_results
             ],
-            "segments": journey_response.segments,
+            "segments": journey_response.route_segments,
         }
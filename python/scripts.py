@@ -1,37 +1,63 @@
 #!/usr/bin/env python3
 """Helper scripts for development tasks."""
 
+import asyncio
 import subprocess
 import sys
 
 
-def run_command(cmd: str) -> int:
-    """Run a shell command and return exit code."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True)
+def run_command(cmd: list[str]) -> int:
+    """Run a command (without a shell) and return exit code."""
+    print(f"Running: {' '.join(cmd)}")
+    result = subprocess.run(cmd)
     return result.returncode
 
 
+async def run_command_async(cmd: list[str]) -> tuple[int, str]:
+    """Run a command (without a shell), capturing its combined output."""
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    output, _ = await process.communicate()
+    return await process.wait(), output.decode(errors="replace")
+
+
+async def run_commands_parallel(commands: list[list[str]]) -> list[tuple[int, str]]:
+    """Run independent commands concurrently."""
+    return await asyncio.gather(*[run_command_async(cmd) for cmd in commands])
+
+
 def check() -> None:
     """Run all checks (linting, type checking, tests)."""
     print("=" * 60)
     print("Running all checks...")
     print("=" * 60)
 
+    # Linters and the type checker don't depend on each other, so run them
+    # together and print each one's output once it has finished
     commands = [
-        "poetry run ruff check camino_ai tests",
-        "poetry run black --check camino_ai tests",
-        "poetry run isort --check-only camino_ai tests",
-        "poetry run mypy camino_ai",
-        "poetry run pytest --cov=camino_ai --cov-report=term-missing",
+        ["poetry", "run", "ruff", "check", "camino_ai", "tests"],
+        ["poetry", "run", "black", "--check", "camino_ai", "tests"],
+        ["poetry", "run", "isort", "--check-only", "camino_ai", "tests"],
+        ["poetry", "run", "mypy", "camino_ai"],
     ]
 
-    for cmd in commands:
-        exit_code = run_command(cmd)
+    results = asyncio.run(run_commands_parallel(commands))
+    for cmd, (_, output) in zip(commands, results):
+        print(f"Running: {' '.join(cmd)}")
+        print(output)
+
+    for cmd, (exit_code, _) in zip(commands, results):
         if exit_code != 0:
-            print(f"\n❌ Command failed: {cmd}")
+            print(f"\n❌ Command failed: {' '.join(cmd)}")
             sys.exit(exit_code)
-        print()
+
+    cmd = ["poetry", "run", "pytest", "--cov=camino_ai", "--cov-report=term-missing"]
+    exit_code = run_command(cmd)
+    if exit_code != 0:
+        print(f"\n❌ Command failed: {' '.join(cmd)}")
+        sys.exit(exit_code)
+    print()
 
     print("=" * 60)
     print("✅ All checks passed!")
@@ -45,9 +71,9 @@ def format() -> None:
     print("=" * 60)
 
     commands = [
-        "poetry run ruff check --fix camino_ai tests",
-        "poetry run black camino_ai tests",
-        "poetry run isort camino_ai tests",
+        ["poetry", "run", "ruff", "check", "--fix", "camino_ai", "tests"],
+        ["poetry", "run", "black", "camino_ai", "tests"],
+        ["poetry", "run", "isort", "camino_ai", "tests"],
     ]
 
     for cmd in commands:
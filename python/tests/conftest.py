@@ -0,0 +1,31 @@
+"""Shared fixtures for the Camino AI test suite."""
+
+import pytest
+
+from camino_ai.models import Coordinate, QueryResult
+
+
+@pytest.fixture(scope="module")
+def nyc_coord() -> Coordinate:
+    """Upper West Side coordinate, built without re-running validation."""
+    return Coordinate.model_construct(lat=40.7831, lon=-73.9712)
+
+
+@pytest.fixture(scope="module")
+def midtown_coord() -> Coordinate:
+    """Midtown Manhattan coordinate, built without re-running validation."""
+    return Coordinate.model_construct(lat=40.7589, lon=-73.9851)
+
+
+@pytest.fixture(scope="module")
+def central_perk(nyc_coord: Coordinate) -> QueryResult:
+    """Validated cafe result shared by tests that only read its fields."""
+    return QueryResult(
+        id=123,
+        type="node",
+        location=nyc_coord,
+        tags={"name": "Central Perk", "phone": "555-1234"},
+        name="Central Perk",
+        amenity="cafe",
+        relevance_rank=1,
+    )
@@ -1,8 +1,10 @@
 """Tests for the Camino AI Python client."""
 
+import asyncio
+from functools import partial
 
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
 
 from camino_ai import CaminoAI
 from camino_ai.models import (
@@ -18,15 +20,58 @@ from camino_ai.models import (
     RelationshipResponse,
 )
 
+_EMPTY_QUERY_RESPONSE = {
+    "query": "test query",
+    "results": [],
+    "ai_ranked": True,
+    "pagination": {
+        "total_results": 0,
+        "limit": 20,
+        "offset": 0,
+        "returned_count": 0,
+        "has_more": False,
+    },
+}
+
+_routes: dict = {}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Serve the canned response registered for this method and URL."""
+    try:
+        return _routes[request.method, str(request.url)]
+    except KeyError:
+        return httpx.Response(
+            404, json={"message": f"No mock for {request.method} {request.url}"}
+        )
+
+
+@pytest.fixture(scope="module")
+def client():
+    """CaminoAI client shared by every test in this module, served in-process."""
+    transport = httpx.MockTransport(_handler)
+    http_client = httpx.Client(transport=transport)
+    async_http_client = httpx.AsyncClient(transport=transport)
+    yield CaminoAI(
+        api_key="test-api-key",
+        http_client=http_client,
+        async_http_client=async_http_client,
+    )
+    http_client.close()
+    asyncio.run(async_http_client.aclose())
+
+
+@pytest.fixture
+def mock_api():
+    """Routes for the mock transport, keyed on (method, url)."""
+    _routes.clear()
+    yield _routes
+    _routes.clear()
+
 
 class TestCaminoAI:
     """Test suite for CaminoAI client."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.api_key = "test-api-key"
-        self.client = CaminoAI(api_key=self.api_key)
-
     def test_init_with_defaults(self):
         """Test client initialization with default values."""
         client = CaminoAI(api_key="test-key")
@@ -61,15 +106,95 @@ class TestCaminoAI:
         }
         assert client._headers == expected_headers
 
+    @pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+    async def test_default_http_client(self, monkeypatch, use_async: bool):
+        """Test that the lazily built default clients send the API headers."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("X-API-Key"))
+            return httpx.Response(200, json=_EMPTY_QUERY_RESPONSE)
+
+        # Route the clients CaminoAI builds itself through the mock transport
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(
+            "camino_ai.client.Client", partial(httpx.Client, transport=transport)
+        )
+        monkeypatch.setattr(
+            "camino_ai.client.AsyncClient",
+            partial(httpx.AsyncClient, transport=transport),
+        )
+
+        client = CaminoAI(api_key="test-key")
+        assert client._request_headers is None
+        if use_async:
+            async with client:
+                response = await client.query_async("test query")
+        else:
+            with client:
+                response = client.query("test query")
+
+        assert isinstance(response, QueryResponse)
+        assert seen == ["test-key"]
+
+    @pytest.mark.asyncio
+    async def test_injected_async_http_client(self):
+        """Test that a provided httpx.AsyncClient is used with the API headers."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("X-API-Key"))
+            return httpx.Response(200, json=_EMPTY_QUERY_RESPONSE)
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = CaminoAI(api_key="test-key", async_http_client=http_client)
+            assert client.async_client is http_client
+
+            response = await client.query_async("test query")
+            assert isinstance(response, QueryResponse)
+            assert seen == ["test-key"]
+
+    async def test_close_leaves_injected_http_clients_open(self):
+        """Test that close()/aclose() don't close clients the caller provided."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json=_EMPTY_QUERY_RESPONSE)
+        )
+        with httpx.Client(transport=transport) as http_client:
+            async with httpx.AsyncClient(transport=transport) as async_http_client:
+                for _ in range(2):
+                    async with CaminoAI(
+                        api_key="test-key",
+                        http_client=http_client,
+                        async_http_client=async_http_client,
+                    ) as client:
+                        client.query("test query")
+                        await client.query_async("test query")
+                    client.close()
+
+                assert not http_client.is_closed
+                assert not async_http_client.is_closed
+
+    async def test_close_closes_default_http_clients(self):
+        """Test that close()/aclose() close the clients the SDK created."""
+        client = CaminoAI(api_key="test-key")
+        sync_client, async_client = client.sync_client, client.async_client
+
+        client.close()
+        await client.aclose()
+
+        assert sync_client.is_closed
+        assert async_client.is_closed
+
 
 class TestQueryMethods:
     """Test query-related methods."""
 
-    def setup_method(self):
-        self.client = CaminoAI(api_key="test-api-key")
-
-    def test_query_with_string(self, httpx_mock: HTTPXMock):
-        """Test query method with string input."""
+    @pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+    async def test_query_with_string(
+        self, client: CaminoAI, mock_api: dict, use_async: bool
+    ):
+        """Test sync and async query methods with string input."""
         mock_response = {
             "query": "coffee shops",
             "results": [
@@ -93,20 +218,22 @@ class TestQueryMethods:
             },
         }
 
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=coffee+shops&rank=true&limit=20&offset=0&answer=false&mode=basic",
-            json=mock_response,
-        )
+        mock_api[
+            "GET",
+            "https://api.getcamino.ai/query?query=coffee+shops&rank=true&limit=20&offset=0&answer=false&mode=basic",
+        ] = httpx.Response(200, json=mock_response)
 
-        response = self.client.query("coffee shops")
+        if use_async:
+            response = await client.query_async("coffee shops")
+        else:
+            response = client.query("coffee shops")
 
         assert isinstance(response, QueryResponse)
         assert len(response.results) == 1
         assert response.results[0].name == "Central Perk"
         assert response.pagination.total_results == 1
 
-    def test_query_with_request_object(self, httpx_mock: HTTPXMock):
+    def test_query_with_request_object(self, client: CaminoAI, mock_api: dict):
         """Test query method with QueryRequest object."""
         mock_response = {
             "query": "coffee shops",
@@ -121,43 +248,16 @@ class TestQueryMethods:
             },
         }
 
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=coffee+shops&lat=40.7831&lon=-73.9712&radius=1000&rank=true&limit=10&offset=0&answer=false&mode=basic",
-            json=mock_response,
-        )
+        mock_api[
+            "GET",
+            "https://api.getcamino.ai/query?query=coffee+shops&lat=40.7831&lon=-73.9712&radius=1000&rank=true&limit=10&offset=0&answer=false&mode=basic",
+        ] = httpx.Response(200, json=mock_response)
 
         request = QueryRequest(
             query="coffee shops", lat=40.7831, lon=-73.9712, radius=1000, limit=10
         )
 
-        response = self.client.query(request)
-        assert isinstance(response, QueryResponse)
-        assert response.pagination.total_results == 0
-
-    @pytest.mark.asyncio
-    async def test_query_async(self, httpx_mock: HTTPXMock):
-        """Test async query method."""
-        mock_response = {
-            "query": "test query",
-            "results": [],
-            "ai_ranked": True,
-            "pagination": {
-                "total_results": 0,
-                "limit": 20,
-                "offset": 0,
-                "returned_count": 0,
-                "has_more": False,
-            },
-        }
-
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=test+query&rank=true&limit=20&offset=0&answer=false&mode=basic",
-            json=mock_response,
-        )
-
-        response = await self.client.query_async("test query")
+        response = client.query(request)
         assert isinstance(response, QueryResponse)
         assert response.pagination.total_results == 0
 
@@ -165,10 +265,7 @@ class TestQueryMethods:
 class TestRelationshipMethods:
     """Test relationship-related methods."""
 
-    def setup_method(self):
-        self.client = CaminoAI(api_key="test-api-key")
-
-    def test_relationship(self, httpx_mock: HTTPXMock):
+    def test_relationship(self, client: CaminoAI, mock_api: dict):
         """Test relationship method."""
         mock_response = {
             "distance": "1.2 km",
@@ -180,18 +277,17 @@ class TestRelationshipMethods:
             "description": "The location is 1.2 km southwest, approximately 15 minutes walking",
         }
 
-        httpx_mock.add_response(
-            method="POST",
-            url="https://api.getcamino.ai/relationship",
-            json=mock_response,
-        )
+        mock_api[
+            "POST",
+            "https://api.getcamino.ai/relationship",
+        ] = httpx.Response(200, json=mock_response)
 
         request = RelationshipRequest(
             start=Coordinate(lat=40.7831, lon=-73.9712),
             end=Coordinate(lat=40.7589, lon=-73.9851),
         )
 
-        response = self.client.relationship(request)
+        response = client.relationship(request)
         assert isinstance(response, RelationshipResponse)
         assert response.distance == "1.2 km"
         assert response.direction == "southwest"
@@ -205,10 +301,7 @@ class TestRelationshipMethods:
 class TestContextMethods:
     """Test context-related methods."""
 
-    def setup_method(self):
-        self.client = CaminoAI(api_key="test-api-key")
-
-    def test_context(self, httpx_mock: HTTPXMock):
+    def test_context(self, client: CaminoAI, mock_api: dict):
         """Test context method."""
         mock_response = {
             "area_description": "Upper West Side neighborhood in Manhattan, characterized by residential buildings and cultural institutions",
@@ -227,15 +320,16 @@ class TestContextMethods:
             "total_places_found": 47,
         }
 
-        httpx_mock.add_response(
-            method="POST", url="https://api.getcamino.ai/context", json=mock_response
-        )
+        mock_api[
+            "POST",
+            "https://api.getcamino.ai/context",
+        ] = httpx.Response(200, json=mock_response)
 
         request = ContextRequest(
             location=Coordinate(lat=40.7831, lon=-73.9712), radius=500
         )
 
-        response = self.client.context(request)
+        response = client.context(request)
         assert isinstance(response, ContextResponse)
         assert response.location.lat == 40.7831
         assert response.location.lon == -73.9712
@@ -248,55 +342,50 @@ class TestContextMethods:
 class TestErrorHandling:
     """Test error handling and exception raising."""
 
-    def setup_method(self):
-        self.client = CaminoAI(api_key="test-api-key")
-
-    def test_authentication_error(self, httpx_mock: HTTPXMock):
-        """Test authentication error handling."""
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=test&rank=true&limit=20&offset=0&answer=false&mode=basic",
-            status_code=401,
-            json={"message": "Invalid API key"},
-        )
-
-        with pytest.raises(AuthenticationError) as exc_info:
-            self.client.query("test")
-
-        assert exc_info.value.status_code == 401
-        assert "Invalid API key" in str(exc_info.value)
-
-    def test_rate_limit_error(self, httpx_mock: HTTPXMock):
-        """Test rate limit error handling."""
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=test&rank=true&limit=20&offset=0&answer=false&mode=basic",
-            status_code=429,
-            headers={"Retry-After": "60"},
-            json={"message": "Rate limit exceeded"},
+    @pytest.mark.parametrize(
+        "status_code, headers, message, error_class",
+        [
+            (401, {}, "Invalid API key", AuthenticationError),
+            (429, {"Retry-After": "60"}, "Rate limit exceeded", RateLimitError),
+            (500, {}, "Internal server error", APIError),
+        ],
+    )
+    def test_error_responses(
+        self,
+        client: CaminoAI,
+        mock_api: dict,
+        status_code,
+        headers,
+        message,
+        error_class,
+    ):
+        """Test that error statuses raise the matching exception."""
+        mock_api[
+            "GET",
+            "https://api.getcamino.ai/query?query=test&rank=true&limit=20&offset=0&answer=false&mode=basic",
+        ] = httpx.Response(status_code, headers=headers, json={"message": message})
+
+        with pytest.raises(error_class) as exc_info:
+            client.query("test")
+
+        assert type(exc_info.value) is error_class
+        assert exc_info.value.status_code == status_code
+        assert message in str(exc_info.value)
+
+    def test_rate_limit_retry_after(self, client: CaminoAI, mock_api: dict):
+        """Test that the Retry-After header is exposed on rate limit errors."""
+        mock_api[
+            "GET",
+            "https://api.getcamino.ai/query?query=test&rank=true&limit=20&offset=0&answer=false&mode=basic",
+        ] = httpx.Response(
+            429, headers={"Retry-After": "60"}, json={"message": "Rate limit exceeded"}
         )
 
         with pytest.raises(RateLimitError) as exc_info:
-            self.client.query("test")
+            client.query("test")
 
-        assert exc_info.value.status_code == 429
         assert exc_info.value.retry_after == 60
 
-    def test_generic_api_error(self, httpx_mock: HTTPXMock):
-        """Test generic API error handling."""
-        httpx_mock.add_response(
-            method="GET",
-            url="https://api.getcamino.ai/query?query=test&rank=true&limit=20&offset=0&answer=false&mode=basic",
-            status_code=500,
-            json={"message": "Internal server error"},
-        )
-
-        with pytest.raises(APIError) as exc_info:
-            self.client.query("test")
-
-        assert exc_info.value.status_code == 500
-        assert "Internal server error" in str(exc_info.value)
-
 
 class TestContextManagers:
     """Test context manager functionality."""
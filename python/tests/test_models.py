@@ -1,18 +1,17 @@
 """Tests for Camino AI data models."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter
+from pydantic_core import ValidationError, from_json
 
+from camino_ai.errors import APIError, AuthenticationError, CaminoError, RateLimitError
 from camino_ai.models import (
-    APIError,
-    AuthenticationError,
-    CaminoError,
     Coordinate,
     JourneyRequest,
+    Pagination,
     QueryRequest,
     QueryResponse,
     QueryResult,
-    RateLimitError,
     RelationshipRequest,
     RelationshipResponse,
     RouteSegment,
@@ -20,6 +19,47 @@ from camino_ai.models import (
     Waypoint,
 )
 
+_QUERY_RESPONSE_DATA = {
+    "query": "test",
+    "results": [
+        {
+            "id": 123,
+            "type": "node",
+            "location": {"lat": 40.7831, "lon": -73.9712},
+            "tags": {"name": "Test Place"},
+            "name": "Test Place",
+            "relevance_rank": 1,
+        }
+    ],
+    "ai_ranked": True,
+    "pagination": {
+        "total_results": 1,
+        "limit": 20,
+        "offset": 0,
+        "returned_count": 1,
+        "has_more": False,
+    },
+}
+
+_WAYPOINTS_TA = TypeAdapter(list[Waypoint])
+
+
+@pytest.fixture(scope="module")
+def query_dump_exclude_none() -> dict:
+    """Serialized minimal QueryRequest with None values dropped."""
+    return QueryRequest(query="test").model_dump(exclude_none=True)
+
+
+@pytest.fixture(scope="module")
+def query_dump() -> dict:
+    """Serialized minimal QueryRequest with every field included."""
+    return QueryRequest(query="test").model_dump()
+
+
+def _coord_eq(a, b) -> bool:
+    """Compare two coordinate-like objects by latitude and longitude."""
+    return (a.lat, a.lon) == (b.lat, b.lon)
+
 
 class TestCoordinate:
     """Test Coordinate model."""
@@ -30,116 +70,119 @@ class TestCoordinate:
         assert coord.lat == 40.7831
         assert coord.lon == -73.9712
 
-    def test_coordinate_validation(self):
-        """Test coordinate validation."""
-        # Test missing required fields
-        with pytest.raises(ValidationError):
-            Coordinate(lat=40.7831)  # Missing lon
+    def test_coordinate_from_arrays(self):
+        """Test building coordinates from parallel sequences."""
+        coords = Coordinate.from_arrays([40.7831, 40.7589], [-73.9712, -73.9851])
+        assert coords == [
+            Coordinate(lat=40.7831, lon=-73.9712),
+            Coordinate(lat=40.7589, lon=-73.9851),
+        ]
+
+        with pytest.raises(ValueError):
+            Coordinate.from_arrays([40.7831], [])
 
+    @pytest.mark.parametrize(
+        "kwargs", [{"lat": 40.7831}, {"lon": -73.9712}], ids=["no-lon", "no-lat"]
+    )
+    def test_coordinate_validation(self, kwargs: dict):
+        """Test that missing required fields are rejected."""
         with pytest.raises(ValidationError):
-            Coordinate(lon=-73.9712)  # Missing lat
+            Coordinate(**kwargs)
 
-    def test_coordinate_serialization(self):
+    def test_coordinate_serialization(self, nyc_coord: Coordinate):
         """Test coordinate serialization."""
-        coord = Coordinate(lat=40.7831, lon=-73.9712)
-        data = coord.model_dump()
-        expected = {"lat": 40.7831, "lon": -73.9712}
-        assert data == expected
+        data = nyc_coord.model_dump()
+        assert data["lat"] == 40.7831
+        assert data["lon"] == -73.9712
+        assert len(data) == 2
 
 
 class TestTransportMode:
     """Test TransportMode enum."""
 
-    def test_transport_modes(self):
-        """Test all transport mode values."""
-        assert TransportMode.DRIVING == "driving"
-        assert TransportMode.WALKING == "walking"
-        assert TransportMode.CYCLING == "cycling"
-        assert TransportMode.TRANSIT == "transit"
-
-    def test_transport_mode_in_model(self):
-        """Test transport mode usage in models."""
-        constraints = {"transport_mode": TransportMode.DRIVING}
-        assert constraints["transport_mode"] == "driving"
+    @pytest.mark.parametrize(
+        "mode, value",
+        [
+            (TransportMode.DRIVING, "driving"),
+            (TransportMode.WALKING, "walking"),
+            (TransportMode.CYCLING, "cycling"),
+            (TransportMode.TRANSIT, "transit"),
+        ],
+    )
+    def test_transport_modes(self, mode: TransportMode, value: str):
+        """Test each transport mode value."""
+        assert mode == value
 
 
 class TestQueryModels:
     """Test query-related models."""
 
-    def test_query_request_minimal(self):
-        """Test minimal QueryRequest."""
-        request = QueryRequest(query="coffee shops")
-        assert request.query == "coffee shops"
-        assert request.lat is None
-        assert request.lon is None
-        assert request.radius is None
-        assert request.limit == 20  # Default value
-
-    def test_query_request_full(self):
-        """Test full QueryRequest with all fields."""
-        request = QueryRequest(
-            query="coffee shops", lat=40.7831, lon=-73.9712, radius=1000, limit=10
-        )
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {"query": "coffee shops"},
+                {"lat": None, "lon": None, "radius": None, "limit": 20},
+            ),
+            (
+                {
+                    "query": "coffee shops",
+                    "lat": 40.7831,
+                    "lon": -73.9712,
+                    "radius": 1000,
+                    "limit": 10,
+                },
+                {"lat": 40.7831, "lon": -73.9712, "radius": 1000, "limit": 10},
+            ),
+        ],
+        ids=["minimal", "full"],
+    )
+    def test_query_request(self, kwargs, expected):
+        """Test QueryRequest with minimal and full field sets."""
+        request = QueryRequest(**kwargs)
         assert request.query == "coffee shops"
-        assert request.lat == 40.7831
-        assert request.lon == -73.9712
-        assert request.radius == 1000
-        assert request.limit == 10
+        for field, value in expected.items():
+            assert getattr(request, field) == value
 
-    def test_query_result(self):
+    def test_query_result(self, central_perk: QueryResult):
         """Test QueryResult model."""
-        result = QueryResult(
-            id=123,
-            type="node",
-            location=Coordinate(lat=40.7831, lon=-73.9712),
-            tags={"name": "Central Perk", "phone": "555-1234"},
-            name="Central Perk",
-            amenity="cafe",
-            relevance_rank=1,
-        )
-        assert result.name == "Central Perk"
-        assert result.location.lat == 40.7831
-        assert result.location.lon == -73.9712
-        assert result.amenity == "cafe"
-        assert result.tags["phone"] == "555-1234"
-
-    def test_query_response(self):
-        """Test QueryResponse model."""
-        result = QueryResult(
-            id=123,
-            type="node",
-            location=Coordinate(lat=40.7831, lon=-73.9712),
-            tags={"name": "Test Place"},
-            name="Test Place",
-            relevance_rank=1,
-        )
-        response = QueryResponse(
-            query="test query",
-            results=[result],
-            ai_ranked=True,
-            pagination={
-                "total_results": 1,
-                "limit": 20,
-                "offset": 0,
-                "returned_count": 1,
-                "has_more": False,
-            },
-        )
-        assert len(response.results) == 1
+        assert central_perk.name == "Central Perk"
+        assert central_perk.location.lat == 40.7831
+        assert central_perk.location.lon == -73.9712
+        assert central_perk.amenity == "cafe"
+        assert central_perk.tags["phone"] == "555-1234"
+
+    def test_query_response(self, central_perk: QueryResult):
+        """Test QueryResponse validates nested results and pagination."""
+        data = {
+            "query": "test query",
+            "results": [central_perk.model_dump()],
+            "ai_ranked": True,
+            "pagination": _QUERY_RESPONSE_DATA["pagination"],
+        }
+        response = QueryResponse.model_validate(data)
+        assert response.results == [central_perk]
+        assert isinstance(response.pagination, Pagination)
         assert response.pagination.total_results == 1
         assert response.query == "test query"
 
+        del data["pagination"]
+        with pytest.raises(ValidationError):
+            QueryResponse.model_validate(data)
+
 
 class TestRelationshipModels:
     """Test relationship-related models."""
 
-    def test_relationship_request(self):
+    def test_relationship_request(
+        self, nyc_coord: Coordinate, midtown_coord: Coordinate
+    ):
         """Test RelationshipRequest model."""
-        from_loc = Coordinate(lat=40.7831, lon=-73.9712)
-        to_loc = Coordinate(lat=40.7589, lon=-73.9851)
-        request = RelationshipRequest(start=from_loc, end=to_loc, include=["distance"])
-        assert request.start == from_loc
-        assert request.end == to_loc
+        request = RelationshipRequest(
+            start=nyc_coord, end=midtown_coord, include=["distance"]
+        )
+        assert _coord_eq(request.start, nyc_coord)
+        assert _coord_eq(request.end, midtown_coord)
         assert request.include == ["distance"]
 
     def test_relationship_response(self):
@@ -192,28 +235,29 @@ class TestJourneyModels:
 
     def test_journey_request(self):
         """Test JourneyRequest model."""
-        waypoints = [
-            Waypoint(lat=40.7831, lon=-73.9712, purpose="Start"),
-            Waypoint(lat=40.7589, lon=-73.9851, purpose="End"),
-        ]
+        waypoints = _WAYPOINTS_TA.validate_python(
+            [
+                {"lat": 40.7831, "lon": -73.9712, "purpose": "Start"},
+                {"lat": 40.7589, "lon": -73.9851, "purpose": "End"},
+            ]
+        )
         constraints = {"transport_mode": TransportMode.WALKING}
         request = JourneyRequest(waypoints=waypoints, constraints=constraints)
         assert len(request.waypoints) == 2
+        assert request.waypoints[1].purpose == "End"
         assert request.constraints == constraints
 
-    def test_route_segment(self):
+    def test_route_segment(self, nyc_coord: Coordinate, midtown_coord: Coordinate):
         """Test RouteSegment model."""
-        start = Coordinate(lat=40.7831, lon=-73.9712)
-        end = Coordinate(lat=40.7589, lon=-73.9851)
         segment = RouteSegment(
-            start=start,
-            end=end,
+            start=nyc_coord,
+            end=midtown_coord,
             distance=1234.56,
             duration=300.0,
             instructions="Turn left on Broadway",
         )
-        assert segment.start == start
-        assert segment.end == end
+        assert _coord_eq(segment.start, nyc_coord)
+        assert _coord_eq(segment.end, midtown_coord)
         assert segment.distance == 1234.56
         assert segment.duration == 300.0
         assert segment.instructions == "Turn left on Broadway"
@@ -222,60 +266,69 @@ class TestJourneyModels:
 class TestExceptionModels:
     """Test exception classes."""
 
-    def test_camino_error_basic(self):
-        """Test basic CaminoError."""
-        error = CaminoError("Something went wrong")
-        assert str(error) == "Something went wrong"
-        assert error.message == "Something went wrong"
-        assert error.details == {}
-
-    def test_camino_error_with_details(self):
-        """Test CaminoError with details."""
-        details = {"code": "TEST_ERROR", "field": "query"}
-        error = CaminoError("Validation failed", details)
-        assert error.message == "Validation failed"
-        assert error.details == details
-
-    def test_api_error(self):
-        """Test APIError."""
-        response = {"error": "Bad request", "code": "INVALID_PARAMS"}
-        error = APIError("Request failed", 400, response)
-        assert error.message == "Request failed"
-        assert error.status_code == 400
-        assert error.response == response
-
-    def test_authentication_error(self):
-        """Test AuthenticationError."""
-        error = AuthenticationError("Invalid API key", 401)
-        assert isinstance(error, APIError)
-        assert error.message == "Invalid API key"
-        assert error.status_code == 401
-
-    def test_rate_limit_error(self):
-        """Test RateLimitError."""
-        error = RateLimitError("Too many requests", 60)
-        assert isinstance(error, APIError)
-        assert error.message == "Too many requests"
-        assert error.retry_after == 60
+    @pytest.mark.parametrize(
+        "error_class, args, expected",
+        [
+            (
+                CaminoError,
+                ("Something went wrong",),
+                {"message": "Something went wrong", "details": {}},
+            ),
+            (
+                CaminoError,
+                ("Validation failed", {"code": "TEST_ERROR", "field": "query"}),
+                {
+                    "message": "Validation failed",
+                    "details": {"code": "TEST_ERROR", "field": "query"},
+                },
+            ),
+            (
+                APIError,
+                ("Request failed", 400, {"error": "Bad request"}),
+                {
+                    "message": "Request failed",
+                    "status_code": 400,
+                    "response": {"error": "Bad request"},
+                },
+            ),
+            (
+                AuthenticationError,
+                ("Invalid API key", 401),
+                {"message": "Invalid API key", "status_code": 401},
+            ),
+            (
+                RateLimitError,
+                ("Too many requests", 60),
+                {"message": "Too many requests", "retry_after": 60},
+            ),
+        ],
+        ids=["camino", "camino-details", "api", "authentication", "rate-limit"],
+    )
+    def test_error_attributes(self, error_class, args, expected):
+        """Test that each exception exposes its constructor arguments."""
+        error = error_class(*args)
+        assert str(error) == expected["message"]
+        for attr, value in expected.items():
+            assert getattr(error, attr) == value
+        if error_class in (AuthenticationError, RateLimitError):
+            assert isinstance(error, APIError)
 
 
 class TestModelSerialization:
     """Test model serialization and deserialization."""
 
-    def test_exclude_none_serialization(self):
+    def test_exclude_none_serialization(self, query_dump_exclude_none: dict):
         """Test that None values are excluded from serialization."""
-        request = QueryRequest(query="test")
-        data = request.model_dump(exclude_none=True)
+        data = query_dump_exclude_none
         # Should only include non-None values and defaults
         assert data["query"] == "test"
-        assert "lat" not in data or data.get("lat") is None
+        assert "lat" not in data
         assert data.get("rank") is True  # default value
         assert data.get("mode") == "basic"  # default value
 
-    def test_include_none_serialization(self):
+    def test_include_none_serialization(self, query_dump: dict):
         """Test that None values are included when requested."""
-        request = QueryRequest(query="test")
-        data = request.model_dump()
+        data = query_dump
         # Should include all fields
         assert data["query"] == "test"
         assert data["lat"] is None
@@ -287,28 +340,13 @@ class TestModelSerialization:
 
     def test_model_validation_from_dict(self):
         """Test model creation from dictionary."""
-        data = {
-            "query": "test",
-            "results": [
-                {
-                    "id": 123,
-                    "type": "node",
-                    "location": {"lat": 40.7831, "lon": -73.9712},
-                    "tags": {"name": "Test Place"},
-                    "name": "Test Place",
-                    "relevance_rank": 1,
-                }
-            ],
-            "ai_ranked": True,
-            "pagination": {
-                "total_results": 1,
-                "limit": 20,
-                "offset": 0,
-                "returned_count": 1,
-                "has_more": False,
-            },
-        }
-        response = QueryResponse.model_validate(data)
+        response = QueryResponse.model_validate(_QUERY_RESPONSE_DATA)
         assert len(response.results) == 1
         assert response.results[0].name == "Test Place"
         assert response.pagination.total_results == 1
+
+    def test_json_roundtrip(self):
+        """Test that a validated response serializes back to its payload."""
+        response = QueryResponse.model_validate(_QUERY_RESPONSE_DATA)
+        data = from_json(response.model_dump_json(exclude_none=True))
+        assert data == _QUERY_RESPONSE_DATA
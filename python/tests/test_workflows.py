@@ -0,0 +1,221 @@
+"""Tests for the Camino AI workflow helpers."""
+
+import asyncio
+
+import httpx
+import pytest
+from pydantic_core import ValidationError
+
+from camino_ai import CaminoAI
+from camino_ai.errors import APIError
+from camino_ai.models import ContextResponse, Coordinate, QueryResponse
+from camino_ai.workflows import AreaExplorer, QuickChain
+
+CONTEXT_RESPONSE = {
+    "area_description": "Upper West Side neighborhood in Manhattan",
+    "relevant_places": {"restaurants": ["The Smith"], "leisure": ["Central Park"]},
+    "location": {"lat": 40.7831, "lon": -73.9712},
+    "search_radius": 1000,
+    "total_places_found": 2,
+}
+
+QUERY_RESPONSE = {
+    "query": "cafe in this area",
+    "results": [
+        {
+            "id": 123,
+            "type": "node",
+            "location": {"lat": 40.7831, "lon": -73.9712},
+            "tags": {"name": "Central Perk", "amenity": "cafe"},
+            "name": "Central Perk",
+            "amenity": "cafe",
+            "relevance_rank": 1,
+        }
+    ],
+    "ai_ranked": True,
+    "pagination": {
+        "total_results": 1,
+        "limit": 10,
+        "offset": 0,
+        "returned_count": 1,
+        "has_more": False,
+    },
+}
+
+RELATIONSHIP_RESPONSE = {
+    "distance": "0.5 km",
+    "direction": "north",
+    "walking_time": "6 minutes",
+    "actual_distance_km": 0.5,
+    "duration_seconds": 360,
+    "driving_time": "2 minutes",
+    "description": "0.5 km north",
+}
+
+JOURNEY_RESPONSE = {
+    "feasible": True,
+    "total_distance_km": 1.2,
+    "total_time_minutes": 15,
+    "total_time_formatted": "15 minutes",
+    "transport_mode": "walking",
+    "route_segments": [],
+    "analysis": {"summary": "Short walk", "optimization_opportunities": []},
+}
+
+
+@pytest.fixture
+def routes():
+    """Canned responses keyed on request path; a list is served in order."""
+    return {}
+
+
+@pytest.fixture
+def calls():
+    """Paths of the requests the mock transport has received."""
+    return []
+
+
+@pytest.fixture
+async def client(routes, calls):
+    """CaminoAI client whose async requests are served in-process."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        response = routes[request.url.path]
+        return response.pop(0) if isinstance(response, list) else response
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as http_client:
+        yield CaminoAI(api_key="test-key", async_http_client=http_client)
+
+
+class TestAreaExplorer:
+    """Test the explore → query → journey workflow."""
+
+    async def test_explore_and_plan(self, client, routes, calls):
+        """Test that the workflow finds POIs and plans a journey through them."""
+        routes["/context"] = httpx.Response(200, json=CONTEXT_RESPONSE)
+        routes["/query"] = httpx.Response(200, json=QUERY_RESPONSE)
+        routes["/relationship"] = httpx.Response(200, json=RELATIONSHIP_RESPONSE)
+        routes["/journey"] = httpx.Response(200, json=JOURNEY_RESPONSE)
+
+        result = await AreaExplorer(client).explore_and_plan(
+            Coordinate(lat=40.7831, lon=-73.9712), poi_types=["cafes", "parks"]
+        )
+
+        assert result.success, result.error_message
+        assert result.total_pois_found == 2
+        assert result.selected_pois[0].distance_from_origin == 500.0
+        assert result.journey_distance == 1200.0
+        assert result.journey_duration == 900
+        assert calls.count("/query") == 2
+        assert calls.count("/relationship") == 2
+
+    async def test_request_fan_out_is_bounded(self, routes):
+        """Test that concurrent query and distance calls respect the limit."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return routes[request.url.path]
+
+        routes["/query"] = httpx.Response(200, json=QUERY_RESPONSE)
+        routes["/relationship"] = httpx.Response(200, json=RELATIONSHIP_RESPONSE)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = CaminoAI(api_key="test-key", async_http_client=http_client)
+            explorer = AreaExplorer(client, max_concurrent_requests=2)
+            pois = await explorer._query_poi_details(
+                Coordinate(lat=40.7831, lon=-73.9712),
+                poi_types=["cafes", "parks", "museums", "shops"],
+                radius=1000,
+                max_per_type=3,
+            )
+
+        assert len(pois) == 4
+        assert peak == 2
+
+
+class TestQuickChainContextCache:
+    """Test the per-instance area context cache."""
+
+    async def test_repeated_lookup_hits_cache(self, client, routes, calls):
+        """Test that nearby locations with the same radius share one request."""
+        routes["/context"] = httpx.Response(200, json=CONTEXT_RESPONSE)
+        chain = QuickChain(client)
+
+        first = await chain._get_context(Coordinate(lat=40.78312, lon=-73.9712), 1000)
+        second = await chain._get_context(Coordinate(lat=40.78309, lon=-73.9712), 1000)
+
+        assert isinstance(first, ContextResponse)
+        assert second is first
+        assert calls == ["/context"]
+
+    async def test_concurrent_lookups_share_request(self, client, routes, calls):
+        """Test that concurrent callers await a single in-flight request."""
+        routes["/context"] = httpx.Response(200, json=CONTEXT_RESPONSE)
+        chain = QuickChain(client)
+        location = Coordinate(lat=40.7831, lon=-73.9712)
+
+        first, second = await asyncio.gather(
+            chain._get_context(location, 1000), chain._get_context(location, 1000)
+        )
+
+        assert second is first
+        assert calls == ["/context"]
+
+    @pytest.mark.parametrize(
+        "failure, error_class",
+        [
+            (httpx.Response(500, json={"message": "Server error"}), APIError),
+            (httpx.Response(200, json={"search_radius": 1000}), ValidationError),
+        ],
+        ids=["api-error", "malformed-body"],
+    )
+    async def test_failure_is_evicted(
+        self, client, routes, calls, failure, error_class
+    ):
+        """Test that a failed lookup is retried instead of served from cache."""
+        routes["/context"] = [failure, httpx.Response(200, json=CONTEXT_RESPONSE)]
+        chain = QuickChain(client)
+        location = Coordinate(lat=40.7831, lon=-73.9712)
+
+        with pytest.raises(error_class):
+            await chain._get_context(location, 1000)
+
+        response = await chain._get_context(location, 1000)
+        assert isinstance(response, ContextResponse)
+        assert calls == ["/context", "/context"]
+
+    async def test_context_to_query(self, client, routes, calls):
+        """Test that context_to_query looks up context and returns query results."""
+        routes["/context"] = httpx.Response(200, json=CONTEXT_RESPONSE)
+        routes["/query"] = httpx.Response(200, json=QUERY_RESPONSE)
+        chain = QuickChain(client)
+
+        results = await chain.context_to_query(
+            Coordinate(lat=40.7831, lon=-73.9712), "cafe"
+        )
+
+        assert [result.name for result in results] == ["Central Perk"]
+        assert calls == ["/context", "/query"]
+
+    async def test_query_to_journey(self, client, routes, calls):
+        """Test that query results are planned into a journey."""
+        routes["/journey"] = httpx.Response(200, json=JOURNEY_RESPONSE)
+        chain = QuickChain(client)
+        results = QueryResponse.model_validate(QUERY_RESPONSE).results
+
+        journey = await chain.query_to_journey(
+            Coordinate(lat=40.7831, lon=-73.9712), results
+        )
+
+        assert journey["total_distance"] == 1200.0
+        assert journey["total_duration"] == 900
+        assert journey["selected_pois"][0]["name"] == "Central Perk"
+        assert calls == ["/journey"]